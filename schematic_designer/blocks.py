@@ -0,0 +1,115 @@
+import tkinter as tk
+import uuid
+from .schematic_file import ComponentRecord, expand_block
+
+class BlockInstance:
+    """
+    Represents a placed block (an instanced sub-circuit) on the canvas.
+
+    The components of a block are stored once, in the block definitions of the
+    schematic designer, relative to the block origin. A placement only stores its
+    position and rotation; its components are expanded from the shared definition
+    whenever it is rendered, so editing the definition updates every placement.
+    Symbol images are shared between all placements through the schematic designer.
+
+    Attributes:
+        canvas (tk.Canvas): The canvas where the block is displayed.
+        schematic_designer (SchematicDesigner): The parent schematic designer tool.
+        block_name (str): The name of the block definition.
+        x (float): The x-coordinate of the block origin on the canvas.
+        y (float): The y-coordinate of the block origin on the canvas.
+        rotation_angle (int): The rotation angle of the block around its origin (in degrees).
+        block_id (str): Stable identifier of the placement, kept across save and load.
+        tag (str): Canvas tag shared by all items of the placement.
+
+    Methods:
+        __init__(self, canvas, block_name, x, y, schematic_designer, block_id=None, rotation_angle=0): Constructor method.
+            Initializes the placement and renders it on the canvas.
+
+        render(self): Redraws the components of the block from its definition.
+
+        components(self): Returns the components of the block in canvas coordinates.
+
+        move(self, delta_x, delta_y): Moves the block by the given offset.
+
+        rotate_on_click(self, event): Event handler for rotating the block on a click.
+
+        to_save_data(self): Returns the placement in the format written by SchematicDesigner.save.
+    """
+
+    def __init__(self, canvas, block_name, x, y, schematic_designer, block_id=None, rotation_angle=0):
+        self.canvas = canvas
+        self.schematic_designer = schematic_designer
+        self.block_name = block_name
+        self.x = x
+        self.y = y
+        self.rotation_angle = rotation_angle
+        self.block_id = block_id or uuid.uuid4().hex
+        self.tag = f"block_{self.block_id}"
+
+        self.render()
+
+    def render(self):
+        """
+        Redraws the components of the block from its definition.
+        """
+        self.canvas.delete(self.tag)
+
+        for component in self.components():
+            tk_symbol_image = self.schematic_designer.get_symbol_photo(component.symbol_name, component.rotation_angle)
+            if tk_symbol_image:
+                self.canvas.create_image(component.x, component.y, image=tk_symbol_image, anchor=tk.NW,
+                                         tags=("clickable", "block", self.tag))
+
+        # Bind events for rotation
+        self.canvas.tag_bind(self.tag, '<Button-1>', self.rotate_on_click)
+
+    def components(self):
+        """
+        Returns the components of the block in canvas coordinates.
+
+        Returns:
+            list: A ComponentRecord for each component, with ids of the form "block id/component id".
+        """
+        definition = self.schematic_designer.block_definitions.get(self.block_name, {})
+        return [ComponentRecord(component["id"], component["symbol_name"], component["x"], component["y"],
+                                component["rotation_angle"])
+                for component in expand_block(self.to_save_data(), definition)]
+
+    def move(self, delta_x, delta_y):
+        """
+        Moves the block by the given offset.
+
+        Parameters:
+            delta_x (float): The horizontal offset.
+            delta_y (float): The vertical offset.
+        """
+        self.x += delta_x
+        self.y += delta_y
+        self.canvas.move(self.tag, delta_x, delta_y)
+
+    def rotate_on_click(self, event):
+        """
+        Event handler for rotating the block on a click.
+
+        Rotates the block by 45 degrees around its origin on each click.
+
+        Parameters:
+            event (tk.Event): The Tkinter event object.
+        """
+        if self.schematic_designer.selected_tool == "rotate.png":
+            self.rotation_angle = (self.rotation_angle + 45) % 360
+            self.render()
+
+            # Re-check design rules around the rotated components
+            self.schematic_designer.components_changed(self.components())
+
+    def to_save_data(self):
+        """
+        Returns the placement in the format written by SchematicDesigner.save.
+
+        Returns:
+            dict: The block id, block name, origin and rotation angle.
+        """
+        return {"id": self.block_id, "block_name": self.block_name, "x": self.x, "y": self.y,
+                "rotation_angle": self.rotation_angle}
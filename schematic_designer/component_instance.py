@@ -1,4 +1,5 @@
 import tkinter as tk
+import uuid
 from PIL import Image, ImageTk
 
 class ComponentInstance:
@@ -12,12 +13,13 @@ class ComponentInstance:
         x (int): The x-coordinate of the component instance on the canvas.
         y (int): The y-coordinate of the component instance on the canvas.
         rotation_angle (int): The rotation angle of the component image (in degrees).
+        component_id (str): Stable identifier of the component, kept across save and load.
 
         tk_symbol_image (ImageTk.PhotoImage): The Tkinter-compatible image for displaying on the canvas.
         item (int): The item ID representing the component instance on the canvas.
 
     Methods:
-        __init__(self, canvas, symbol_name, x, y, schematic_designer): Constructor method.
+        __init__(self, canvas, symbol_name, x, y, schematic_designer, component_id=None): Constructor method.
             Initializes the component instance with the given parameters.
 
         rotate_on_click(self, event): Event handler for rotating the component image on a click.
@@ -25,15 +27,20 @@ class ComponentInstance:
 
         load_symbol_image(self): Loads the symbol image for the component instance.
             Returns the Tkinter-compatible image, or None if the image is not found.
+
+        set_rotation_angle(self, rotation_angle): Rotates the component image to the given angle.
+
+        replace_symbol(self, symbol_name): Replaces the symbol of the component instance.
     """
 
-    def __init__(self, canvas, symbol_name, x, y, schematic_designer):
+    def __init__(self, canvas, symbol_name, x, y, schematic_designer, component_id=None):
         self.canvas = canvas
         self.schematic_designer = schematic_designer
         self.symbol_name = symbol_name
         self.x = x
         self.y = y
         self.rotation_angle = 0
+        self.component_id = component_id or uuid.uuid4().hex
 
         # Load the symbol image
         self.original_image = self.load_symbol_image()
@@ -72,6 +79,34 @@ class ComponentInstance:
                 # Update the image item on the canvas
                 self.canvas.itemconfig(self.item, image=self.tk_symbol_image)
 
+                # Re-check design rules around the rotated component
+                self.schematic_designer.components_changed([self])
+
+    def set_rotation_angle(self, rotation_angle):
+        """
+        Rotates the component image to the given angle.
+
+        Uses the rotated symbol images shared by the schematic designer, so rotating
+        many components at once does not create an image per component.
+
+        Parameters:
+            rotation_angle (int): The new rotation angle (in degrees).
+        """
+        self.rotation_angle = rotation_angle % 360
+        self.tk_symbol_image = self.schematic_designer.get_symbol_photo(self.symbol_name, self.rotation_angle)
+        self.canvas.itemconfig(self.item, image=self.tk_symbol_image)
+
+    def replace_symbol(self, symbol_name):
+        """
+        Replaces the symbol of the component instance, keeping its position and rotation.
+
+        Parameters:
+            symbol_name (str): The name of the new component symbol.
+        """
+        self.symbol_name = symbol_name
+        self.original_image = self.load_symbol_image()
+        self.set_rotation_angle(self.rotation_angle)
+
     def load_symbol_image(self):
         """
         Loads the symbol image for the component instance.
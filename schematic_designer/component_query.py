@@ -0,0 +1,170 @@
+class ComponentIndex:
+    """
+    Secondary indexes over the components of a schematic for fast queries.
+
+    Components are indexed by symbol name and by rotation angle. Regions are
+    looked up in a spatial index shared with its owner (the design rule checker),
+    which keeps it up to date, so the bounding boxes are only stored once. A
+    query starts from the smallest matching set and only filters those
+    candidates, instead of scanning every component.
+
+    Attributes:
+        components (dict): Mapping of component id -> component.
+        by_symbol (dict): Mapping of symbol name -> set of component ids.
+        by_rotation (dict): Mapping of rotation angle -> set of component ids.
+        spatial_index (SpatialIndex): Bounding boxes of the components, maintained by its owner.
+
+    Methods:
+        __init__(self, spatial_index): Constructor method.
+            Initializes empty indexes.
+
+        update_components(self, components): Adds or re-indexes components.
+
+        remove_components(self, component_ids): Removes components from the indexes.
+
+        reset(self): Removes every component.
+
+        query(self, symbol_name=None, rotation_angle=None, region=None): Returns the ids of matching components.
+    """
+
+    def __init__(self, spatial_index):
+        """
+        Initialize empty indexes.
+
+        Parameters:
+            spatial_index (SpatialIndex): Bounding boxes of the components, kept up to date by its owner.
+        """
+        self.spatial_index = spatial_index
+        self.reset()
+
+    def update_components(self, components):
+        """
+        Adds or re-indexes components.
+
+        Parameters:
+            components (iterable): Components with component_id, symbol_name, x, y and rotation_angle.
+        """
+        for component in components:
+            component_id = component.component_id
+            self._unindex(component_id)
+
+            self.components[component_id] = component
+            self.indexed_keys[component_id] = (component.symbol_name, component.rotation_angle)
+            self.by_symbol.setdefault(component.symbol_name, set()).add(component_id)
+            self.by_rotation.setdefault(component.rotation_angle, set()).add(component_id)
+
+    def remove_components(self, component_ids):
+        """
+        Removes components from the indexes.
+
+        Parameters:
+            component_ids (iterable): The ids of the components to remove.
+        """
+        for component_id in component_ids:
+            self._unindex(component_id)
+            self.components.pop(component_id, None)
+
+    def reset(self):
+        """
+        Removes every component.
+        """
+        self.components = {}
+        self.indexed_keys = {}
+        self.by_symbol = {}
+        self.by_rotation = {}
+
+    def query(self, symbol_name=None, rotation_angle=None, region=None):
+        """
+        Returns the ids of the components matching every given criterion.
+
+        Parameters:
+            symbol_name (str): Only match components with this symbol, e.g. "capacitor.png".
+            rotation_angle (int): Only match components with this rotation angle.
+            region (tuple): Only match components intersecting this (x1, y1, x2, y2) box.
+
+        Returns:
+            set: The ids of the matching components. All components if no criteria are given.
+        """
+        candidate_sets = []
+        if symbol_name is not None:
+            candidate_sets.append(self.by_symbol.get(symbol_name, set()))
+        if rotation_angle is not None:
+            candidate_sets.append(self.by_rotation.get(rotation_angle % 360, set()))
+        if region is not None:
+            smallest = min(candidate_sets, key=len, default=None)
+            if smallest is not None and len(smallest) < self.spatial_index.estimate_count(region):
+                # Bounds-check the few candidates instead of collecting every component in the region
+                candidate_sets.append(self._in_region(smallest, region))
+            else:
+                candidate_sets.append(self.spatial_index.query(region))
+
+        if not candidate_sets:
+            return set(self.components)
+
+        # Intersect starting from the smallest set
+        candidate_sets.sort(key=len)
+        return candidate_sets[0].intersection(*candidate_sets[1:])
+
+    def _in_region(self, component_ids, region):
+        # Return the components among the ids whose bounding box intersects the region, edges included
+        x1, y1, x2, y2 = region
+        matches = set()
+        for component_id in component_ids:
+            bounds = self.spatial_index.bounds(component_id)
+            if bounds and bounds[0] <= x2 and x1 <= bounds[2] and bounds[1] <= y2 and y1 <= bounds[3]:
+                matches.add(component_id)
+        return matches
+
+    def _unindex(self, component_id):
+        # Remove a component from the symbol and rotation indexes using the keys it was indexed under
+        indexed_keys = self.indexed_keys.pop(component_id, None)
+        if indexed_keys is None:
+            return
+
+        symbol_name, rotation_angle = indexed_keys
+        for index, key in ((self.by_symbol, symbol_name), (self.by_rotation, rotation_angle)):
+            component_ids = index.get(key)
+            if component_ids is not None:
+                component_ids.discard(component_id)
+                if not component_ids:
+                    del index[key]
+
+
+def parse_query(text):
+    """
+    Parses a search query into keyword arguments for ComponentIndex.query.
+
+    A query is a list of space-separated terms, all of which must match:
+        symbol=capacitor            components using capacitor.png
+        rotation=45                 components rotated by 45 degrees
+        region=0,0,400,300          components intersecting the box (x1, y1, x2, y2)
+
+    Parameters:
+        text (str): The query text.
+
+    Returns:
+        dict: The keyword arguments for ComponentIndex.query.
+
+    Raises:
+        ValueError: If a term is not understood.
+    """
+    criteria = {}
+    for term in text.split():
+        name, separator, value = term.partition("=")
+        name = name.lower()
+        if not separator or not value:
+            raise ValueError(f"Expected name=value, got '{term}'")
+
+        if name == "symbol":
+            criteria["symbol_name"] = value if value.endswith(".png") else f"{value}.png"
+        elif name == "rotation":
+            criteria["rotation_angle"] = int(value) % 360
+        elif name == "region":
+            coordinates = [float(coordinate) for coordinate in value.split(",")]
+            if len(coordinates) != 4:
+                raise ValueError(f"Expected region=x1,y1,x2,y2, got '{term}'")
+            x1, y1, x2, y2 = coordinates
+            criteria["region"] = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        else:
+            raise ValueError(f"Unknown search term '{name}'")
+    return criteria
@@ -0,0 +1,314 @@
+import argparse
+import sys
+from .schematic_file import read_schematic, component_records, component_bounds, symbol_pins
+from .spatial_index import SpatialIndex
+
+# Symbol used for wires, whose ends must touch another component
+WIRE_SYMBOL = "wire.png"
+
+class Violation:
+    """
+    A design rule violation found on a component.
+
+    Attributes:
+        rule (str): The name of the rule that was violated.
+        component_id (str): The id of the offending component.
+        message (str): A human-readable description of the violation.
+        bounds (tuple): The (x1, y1, x2, y2) area to mark on the canvas.
+    """
+
+    def __init__(self, rule, component_id, message, bounds):
+        self.rule = rule
+        self.component_id = component_id
+        self.message = message
+        self.bounds = bounds
+
+    def __str__(self):
+        return f"{self.rule}: {self.component_id} {self.message}"
+
+
+class DesignRule:
+    """
+    Base class for the rules run by DesignRuleChecker.
+
+    Subclasses set a name and implement check, which is called for a single
+    component whenever it, or a component near it, changes. Rules look up other
+    components through the checker's spatial index rather than scanning them all.
+
+    Methods:
+        check(self, component, checker): Returns the violations of a component.
+    """
+
+    name = "rule"
+
+    def check(self, component, checker):
+        """
+        Returns the violations of a component.
+
+        Parameters:
+            component: The component to check, with component_id, symbol_name, x, y and rotation_angle.
+            checker (DesignRuleChecker): The checker, giving access to the other components.
+
+        Returns:
+            list: The Violation objects found.
+        """
+        raise NotImplementedError
+
+
+class OverlapRule(DesignRule):
+    """
+    Flags symbols whose bounding boxes overlap another symbol. Wires and exact duplicates are left to other rules.
+    """
+
+    name = "overlap"
+
+    def check(self, component, checker):
+        if component.symbol_name == WIRE_SYMBOL:
+            return []
+
+        x1, y1, x2, y2 = bounds = checker.spatial_index.bounds(component.component_id)
+        for other_id in checker.spatial_index.query(bounds):
+            other = checker.components[other_id]
+            if other_id == component.component_id or other.symbol_name == WIRE_SYMBOL or _is_duplicate(component, other):
+                continue
+
+            # Boxes that only touch along an edge do not overlap
+            other_x1, other_y1, other_x2, other_y2 = checker.spatial_index.bounds(other_id)
+            if min(x2, other_x2) > max(x1, other_x1) and min(y2, other_y2) > max(y1, other_y1):
+                return [Violation(self.name, component.component_id, f"overlaps {other_id}", bounds)]
+        return []
+
+
+class DuplicateRule(DesignRule):
+    """
+    Flags identical symbols stacked at the same position and rotation.
+    """
+
+    name = "duplicate"
+
+    def check(self, component, checker):
+        bounds = checker.spatial_index.bounds(component.component_id)
+        for other_id in checker.spatial_index.query_point(component.x, component.y):
+            if other_id != component.component_id and _is_duplicate(component, checker.components[other_id]):
+                return [Violation(self.name, component.component_id, f"is stacked on {other_id}", bounds)]
+        return []
+
+
+class OutOfBoundsRule(DesignRule):
+    """
+    Flags symbols that extend outside the canvas size.
+    """
+
+    name = "out_of_bounds"
+
+    def check(self, component, checker):
+        x1, y1, x2, y2 = bounds = checker.spatial_index.bounds(component.component_id)
+        canvas_width, canvas_height = checker.canvas_size
+        if x1 < 0 or y1 < 0 or x2 > canvas_width or y2 > canvas_height:
+            return [Violation(self.name, component.component_id,
+                              f"is outside the {canvas_width} x {canvas_height} canvas", bounds)]
+        return []
+
+
+class UnconnectedWireRule(DesignRule):
+    """
+    Flags wire ends that do not touch any other component.
+    """
+
+    name = "unconnected_wire"
+
+    def check(self, component, checker):
+        if component.symbol_name != WIRE_SYMBOL:
+            return []
+
+        violations = []
+        tolerance = checker.tolerance
+        for pin_x, pin_y in symbol_pins(component.x, component.y, component.rotation_angle):
+            touching = checker.spatial_index.query((pin_x - tolerance, pin_y - tolerance, pin_x + tolerance, pin_y + tolerance))
+            touching.discard(component.component_id)
+            if not touching:
+                violations.append(Violation(self.name, component.component_id,
+                                            f"has an unconnected end at ({pin_x:.0f}, {pin_y:.0f})",
+                                            (pin_x - tolerance, pin_y - tolerance, pin_x + tolerance, pin_y + tolerance)))
+        return violations
+
+
+def default_rules():
+    """
+    Returns a new instance of each built-in design rule.
+    """
+    return [OverlapRule(), DuplicateRule(), OutOfBoundsRule(), UnconnectedWireRule()]
+
+
+class DesignRuleChecker:
+    """
+    Incremental design rule checker.
+
+    Components are kept in a spatial index. When components are added, changed or
+    removed, only those components and the components near their old and new
+    positions are re-checked, so each edit costs about the same regardless of
+    the size of the schematic.
+
+    Attributes:
+        canvas_size (tuple): The (width, height) components must stay within.
+        rules (list): The DesignRule objects to run.
+        tolerance (int): Distance (in pixels) within which two components count as touching.
+        components (dict): Mapping of component id -> component.
+        spatial_index (SpatialIndex): Bounding boxes of the components.
+        violations (dict): Mapping of component id -> list of Violation.
+
+    Methods:
+        __init__(self, canvas_size, rules=None, tolerance=5): Constructor method.
+            Initializes an empty checker.
+
+        update_components(self, components): Adds or updates components and re-checks the affected ones.
+
+        remove_components(self, component_ids): Removes components and re-checks their neighbours.
+
+        set_canvas_size(self, canvas_size): Changes the canvas size and re-checks every component.
+
+        reset(self): Removes every component.
+
+        all_violations(self): Returns every current violation.
+    """
+
+    def __init__(self, canvas_size, rules=None, tolerance=5):
+        """
+        Initialize an empty checker.
+
+        Parameters:
+            canvas_size (tuple): The (width, height) components must stay within.
+            rules (list): The DesignRule objects to run, or None for default_rules().
+            tolerance (int): Distance (in pixels) within which two components count as touching.
+        """
+        self.canvas_size = tuple(canvas_size)
+        self.rules = rules if rules is not None else default_rules()
+        self.tolerance = tolerance
+        self.components = {}
+        self.spatial_index = SpatialIndex()
+        self.violations = {}
+
+    def update_components(self, components):
+        """
+        Adds or updates components and re-checks the affected ones.
+
+        Parameters:
+            components (iterable): Components with component_id, symbol_name, x, y and rotation_angle.
+
+        Returns:
+            set: The ids of the components that were re-checked.
+        """
+        affected = set()
+        for component in components:
+            affected |= self._neighbours(component.component_id)
+            self.components[component.component_id] = component
+            self.spatial_index.insert(component.component_id,
+                                      component_bounds(component.x, component.y, component.rotation_angle))
+            affected |= self._neighbours(component.component_id)
+            affected.add(component.component_id)
+
+        self._recheck(affected)
+        return affected
+
+    def remove_components(self, component_ids):
+        """
+        Removes components and re-checks their neighbours.
+
+        Parameters:
+            component_ids (iterable): The ids of the components to remove.
+
+        Returns:
+            set: The ids of the components that were re-checked or removed.
+        """
+        affected = set()
+        for component_id in component_ids:
+            affected |= self._neighbours(component_id)
+            affected.add(component_id)
+            self.spatial_index.remove(component_id)
+            self.components.pop(component_id, None)
+            self.violations.pop(component_id, None)
+
+        self._recheck(affected)
+        return affected
+
+    def set_canvas_size(self, canvas_size):
+        """
+        Changes the canvas size and re-checks every component.
+
+        Parameters:
+            canvas_size (tuple): The new (width, height).
+        """
+        self.canvas_size = tuple(canvas_size)
+        self._recheck(set(self.components))
+
+    def reset(self):
+        """
+        Removes every component.
+        """
+        self.components = {}
+        self.spatial_index.clear()
+        self.violations = {}
+
+    def all_violations(self):
+        """
+        Returns every current violation.
+
+        Returns:
+            list: The Violation objects of all components.
+        """
+        return [violation for violations in self.violations.values() for violation in violations]
+
+    def _neighbours(self, component_id):
+        # Ids of the components within the touching tolerance of a component's current bounds
+        bounds = self.spatial_index.bounds(component_id)
+        if bounds is None:
+            return set()
+
+        x1, y1, x2, y2 = bounds
+        return self.spatial_index.query((x1 - self.tolerance, y1 - self.tolerance,
+                                         x2 + self.tolerance, y2 + self.tolerance))
+
+    def _recheck(self, component_ids):
+        # Run every rule on the given components that still exist
+        for component_id in component_ids:
+            component = self.components.get(component_id)
+            if component is not None:
+                self.violations[component_id] = [violation for rule in self.rules
+                                                 for violation in rule.check(component, self)]
+
+
+def _is_duplicate(component, other):
+    # Two components are duplicates if the same symbol is stacked at the same position and rotation
+    return (component.symbol_name == other.symbol_name and component.rotation_angle == other.rotation_angle
+            and abs(component.x - other.x) < 1 and abs(component.y - other.y) < 1)
+
+
+def main(argv=None):
+    """
+    Command line entry point for checking saved schematic files.
+
+    Usage:
+        python -m schematic_designer.design_rules FILE [FILE ...]
+
+    Returns:
+        int: 0 if no violations were found, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="design_rules", description="Run the design rule checks on schematic files.")
+    parser.add_argument("files", nargs="+")
+    args = parser.parse_args(argv)
+
+    violation_count = 0
+    for file_path in args.files:
+        save_data = read_schematic(file_path)
+        checker = DesignRuleChecker(save_data["canvas_size"])
+        checker.update_components(component_records(save_data))
+
+        for violation in checker.all_violations():
+            print(f"{file_path}: {violation}")
+            violation_count += 1
+
+    return 1 if violation_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
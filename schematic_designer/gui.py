@@ -2,11 +2,22 @@ import tkinter as tk
 import json
 from tkinter import ttk
 from PIL import Image, ImageTk, ImageGrab
-from tkinter import filedialog
+from tkinter import filedialog, simpledialog
 from .component_instance import ComponentInstance
 from .tooltip import ToolTip
 from .cd_box import CanvasSizeDialog
 from .user_guide import UserGuideDialog
+from .vector_export import VectorExporter
+from .thumbnail_cache import ThumbnailCache
+from .preview_browser import PreviewBrowser
+from .schematic_diff import SchematicDiff
+from .schematic_file import read_schematic, component_bounds, symbol_pins, SYMBOL_DIRECTORY, SYMBOL_SIZE
+from .design_rules import DesignRuleChecker
+from .routed_wire import RoutedWire
+from .wire_router import WireRouter
+from .blocks import BlockInstance
+from .component_query import ComponentIndex
+from .search_panel import SearchPanel
 
 class SchematicDesigner:
     """
@@ -19,6 +30,14 @@ class SchematicDesigner:
         symbol_images (dict): Dictionary to store images for component symbols.
         component_count (int): Counter for the number of components.
         component_instances (list): List to store instances of ComponentInstance.
+        wires (list): List to store instances of RoutedWire.
+        block_definitions (dict): Block name -> definition, with components relative to the block origin.
+        block_instances (list): List to store placed blocks (BlockInstance).
+        block_photos (dict): Symbol images shared by all block placements, keyed by (symbol_name, rotation_angle).
+        thumbnail_cache (ThumbnailCache): Cache of file previews, created on first use.
+        design_rule_checker (DesignRuleChecker): Incremental design rule checker kept in sync with the canvas.
+        show_violations (tk.BooleanVar): Whether design rule violations are marked on the canvas.
+        component_index (ComponentIndex): Symbol, rotation and region indexes used by the search panel.
 
     Methods:
         __init__(self, root): Initializes the SchematicDesigner instance.
@@ -35,10 +54,34 @@ class SchematicDesigner:
         click_on_item(self, event): Handles clicks on items within the canvas.
         reset_selection(self): Resets the selected item.
         perform_delete_selected_components(self, item_id): Deletes selected components from the canvas.
+        find_nearest_pin(self, x, y): Returns the component pin closest to a point.
+        get_block_instance_by_item(self, item_id): Returns the placed block an item belongs to.
+        get_symbol_photo(self, symbol_name, rotation_angle): Returns a shared, rotated symbol image.
+        define_block_from_region(self): Starts defining a block from the components inside a dragged region.
+        finish_block_region(self, event): Turns the components inside the dragged region into a block.
+        place_block_dialog(self): Asks for a block name and places the block on the canvas.
+        place_block(self, block_name, x, y): Places a block on the canvas.
+        route_wire(self, start_pin, end_pin): Routes a wire between two pins and draws it.
         draw_grid(self, event=None): Draws a grid on the canvas.
+        get_save_data(self): Returns the current state of the canvas as save data.
         save(self): Saves the current state of the canvas to a JSON file.
         export_as_png(self): Exports the canvas as a PNG image.
+        export_as_svg(self): Exports the canvas as an SVG vector image.
+        export_as_pdf(self): Exports the canvas as a PDF vector document.
         open_file(self): Opens a JSON file and loads the data onto the canvas.
+        browse_schematics(self): Opens a preview browser for a directory of JSON files.
+        exit_application(self): Saves the thumbnail index and quits the application.
+        compare_with_file(self): Highlights the components that differ from a saved JSON file.
+        components_changed(self, instances): Re-checks design rules after components are added, moved or rotated.
+        components_removed(self, instances): Re-checks design rules after components are deleted.
+        refresh_violation_markers(self, component_ids): Redraws the violation markers of the given components.
+        toggle_violation_markers(self): Shows or hides all violation markers.
+        open_search_panel(self): Opens the component search panel.
+        highlight_components(self, component_ids): Outlines the given components on the canvas.
+        bulk_rotate(self, component_ids, rotation_angle): Rotates components in a single canvas update.
+        bulk_delete(self, component_ids): Deletes components in a single canvas update.
+        bulk_replace_symbol(self, component_ids, symbol_name): Replaces the symbol of components in a single canvas update.
+        clear_comparison(self): Removes the comparison overlay from the canvas.
         reset_canvas(self): Clears the canvas and resets tool-related states.
         load_from_file(self, filename): Loads data from a JSON file onto the canvas.
         open_user_guide(self): Opens the user guide dialog.
@@ -64,6 +107,14 @@ class SchematicDesigner:
         self.grid_enabled, self.delete_enabled, self.selection_active, self.rotation_enabled = False, False, False, False
         self.component_count = 0
         self.component_instances = []
+        self.wires = []
+        self.routing_enabled, self.route_start = False, None
+        self.block_definitions, self.block_instances, self.block_photos = {}, [], {}
+        self.block_region_name, self.block_region_start = None, None
+        self.thumbnail_cache = None
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_application)
+        self.design_rule_checker = DesignRuleChecker((self.canvas_width, self.canvas_height))
+        self.component_index = ComponentIndex(self.design_rule_checker.spatial_index)
 
     def get_component_instance_by_item(self, item_id):
         for component_instance in self.component_instances:
@@ -79,12 +130,35 @@ class SchematicDesigner:
         file_menu = tk.Menu(self.menu_bar, tearoff=False)
         file_menu.add_command(label="Save", command=self.save)
         file_menu.add_command(label="Export as PNG", command=self.export_as_png)
+        file_menu.add_command(label="Export as SVG", command=self.export_as_svg)
+        file_menu.add_command(label="Export as PDF", command=self.export_as_pdf)
         file_menu.add_command(label="Open...", command=self.open_file)  
+        file_menu.add_command(label="Browse Schematics...", command=self.browse_schematics)
+        file_menu.add_command(label="Compare With...", command=self.compare_with_file)
+        file_menu.add_command(label="Clear Comparison", command=self.clear_comparison)
         file_menu.add_command(label="Change Canvas Size", command=self.change_canvas_size)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.exit_application)
         self.menu_bar.add_cascade(label="File", menu=file_menu)
 
+        # Design Rules menu
+        self.show_violations = tk.BooleanVar(value=False)
+        design_rules_menu = tk.Menu(self.menu_bar, tearoff=False)
+        design_rules_menu.add_checkbutton(label="Show Violations", variable=self.show_violations,
+                                          command=self.toggle_violation_markers)
+        self.menu_bar.add_cascade(label="Design Rules", menu=design_rules_menu)
+
+        # Blocks menu
+        blocks_menu = tk.Menu(self.menu_bar, tearoff=False)
+        blocks_menu.add_command(label="Define Block from Region...", command=self.define_block_from_region)
+        blocks_menu.add_command(label="Place Block...", command=self.place_block_dialog)
+        self.menu_bar.add_cascade(label="Blocks", menu=blocks_menu)
+
+        # Search menu
+        search_menu = tk.Menu(self.menu_bar, tearoff=False)
+        search_menu.add_command(label="Find Components...", command=self.open_search_panel)
+        self.menu_bar.add_cascade(label="Search", menu=search_menu)
+
         # User Guide menu
         user_guide_menu = tk.Menu(self.menu_bar, tearoff=False)
         user_guide_menu.add_command(label="Open User Guide", command=self.open_user_guide)
@@ -103,6 +177,7 @@ class SchematicDesigner:
             "delete.png",
             "rotate.png",
             "grid.png",
+            "draw.png",
             "clear.png" 
         ]
 
@@ -162,6 +237,13 @@ class SchematicDesigner:
             self.rotation_enabled = not self.rotation_enabled
             self.selected_tool = tool_name
             self.update_tool_state()
+        elif tool_name == "draw.png":
+            # Toggle wire routing tool
+            self.routing_enabled = not self.routing_enabled
+            self.selected_tool = tool_name
+            self.route_start = None
+            self.canvas.delete("route_marker")
+            self.update_tool_state()
         elif tool_name == "delete.png":
             # Toggle delete tool
             self.delete_enabled = not self.delete_enabled
@@ -247,6 +329,7 @@ class SchematicDesigner:
 
         # Append the new component instance to the list
         self.component_instances.append(component_instance)
+        self.components_changed([component_instance])
     
     def setup_canvas(self):
         # Create the main canvas container frame
@@ -278,6 +361,7 @@ class SchematicDesigner:
         self.canvas.bind("<B1-Motion>", self.draw)
         self.canvas.bind("<Button-1>", lambda event: self.click_on_item(event))
         self.canvas.bind("<Button-3>", self.draw_move_tool_start)
+        self.canvas.bind("<ButtonRelease-1>", self.finish_block_region)
         self.canvas.bind("<Configure>", self.draw_grid)
 
         # Bind arrow keys for the move tool
@@ -308,13 +392,30 @@ class SchematicDesigner:
 
     def click_on_item(self, event):
         # Handle click events based on the selected tool
-        if self.rotation_enabled and self.selected_tool == "rotate.png":
+        if self.block_region_name is not None:
+            # Start dragging the region of a new block definition
+            self.block_region_start = (event.x, event.y)
+            self.canvas.create_rectangle(event.x, event.y, event.x, event.y, outline="blue", dash=(4, 2),
+                                         tags="block_region")
+        elif self.rotation_enabled and self.selected_tool == "rotate.png":
             # Rotate the selected component by 90 degrees
             if self.selected_item:
                 selected_component = self.get_component_instance_by_item(self.selected_item)
                 if selected_component:
                     rotation_angle = 90
                     selected_component.rotate_on_click(rotation_angle)
+        elif self.routing_enabled and self.selected_tool == "draw.png":
+            # Pick the pin nearest to the click; route a wire once two pins are picked
+            pin = self.find_nearest_pin(event.x, event.y)
+            if pin is None:
+                return
+
+            if self.route_start is None:
+                self.route_start = pin
+                self.canvas.create_oval(pin[0] - 4, pin[1] - 4, pin[0] + 4, pin[1] + 4, outline="blue", width=2,
+                                        tags="route_marker")
+            else:
+                self.route_wire(self.route_start, pin)
         elif self.selection_active and self.selected_tool == "move.png":
             # Handle click events for the move tool
             overlapping_items = self.canvas.find_overlapping(event.x, event.y, event.x + 1, event.y + 1)
@@ -328,7 +429,7 @@ class SchematicDesigner:
             # Handle click events for the delete tool
             overlapping_items = self.canvas.find_overlapping(event.x, event.y, event.x + 1, event.y + 1)
             for item in overlapping_items:
-                if self.canvas.type(item) == "image":
+                if self.canvas.type(item) == "image" or "routed_wire" in self.canvas.gettags(item):
                     # Confirm and delete the selected item
                     result = tk.messagebox.askyesno("Confirmation", "Are you sure you want to delete the selected item?")
                     if result:
@@ -346,7 +447,159 @@ class SchematicDesigner:
         if selected_component:
             self.canvas.delete(item_id)
             self.component_instances.remove(selected_component)
+            self.components_removed([selected_component])
+            self.reset_selection()
+        elif self.get_block_instance_by_item(item_id):
+            # Delete the whole placement of the selected block
+            block_instance = self.get_block_instance_by_item(item_id)
+            self.components_removed(block_instance.components())
+            self.canvas.delete(block_instance.tag)
+            self.block_instances.remove(block_instance)
             self.reset_selection()
+        else:
+            # Delete the selected routed wire
+            for wire in self.wires:
+                if str(wire.item) == str(item_id):
+                    self.canvas.delete(item_id)
+                    self.wires.remove(wire)
+                    break
+
+    def find_nearest_pin(self, x, y, radius=20):
+        # Return the pin of a nearby component closest to the point, or None
+        nearest_pin, nearest_distance = None, radius ** 2
+        spatial_index = self.design_rule_checker.spatial_index
+
+        for component_id in spatial_index.query((x - radius, y - radius, x + radius, y + radius)):
+            component = self.design_rule_checker.components[component_id]
+            for pin_x, pin_y in symbol_pins(component.x, component.y, component.rotation_angle):
+                distance = (pin_x - x) ** 2 + (pin_y - y) ** 2
+                if distance <= nearest_distance:
+                    nearest_pin, nearest_distance = (pin_x, pin_y), distance
+        return nearest_pin
+
+    def get_block_instance_by_item(self, item_id):
+        # Find the placed block whose tag is on the item
+        tags = self.canvas.gettags(item_id)
+        if "block" in tags:
+            for block_instance in self.block_instances:
+                if block_instance.tag in tags:
+                    return block_instance
+        return None
+
+    def get_symbol_photo(self, symbol_name, rotation_angle):
+        # Load a rotated symbol image once and share it between all block placements
+        key = (symbol_name, rotation_angle)
+        if key not in self.block_photos:
+            try:
+                symbol_image = Image.open(SYMBOL_DIRECTORY + symbol_name)
+                symbol_image = symbol_image.resize(SYMBOL_SIZE, Image.BICUBIC).rotate(rotation_angle, expand=True)
+                self.block_photos[key] = ImageTk.PhotoImage(symbol_image)
+            except FileNotFoundError:
+                print(f"Warning: Failed to load symbol image for {symbol_name}")
+                self.block_photos[key] = None
+        return self.block_photos[key]
+
+    def define_block_from_region(self):
+        # Ask for a block name, then let the user drag a region around its components
+        block_name = simpledialog.askstring("Define Block", "Block name:", parent=self.root)
+        if not block_name:
+            return
+
+        if block_name in self.block_definitions:
+            message = f"Replace the definition of '{block_name}'? Every placement of it will be updated."
+            if not tk.messagebox.askyesno("Define Block", message):
+                return
+
+        self.block_region_name = block_name
+
+    def finish_block_region(self, event):
+        # Turn the loose components inside the dragged region into a block definition and place it
+        if self.block_region_name is None or self.block_region_start is None:
+            return
+
+        block_name, (start_x, start_y) = self.block_region_name, self.block_region_start
+        self.block_region_name, self.block_region_start = None, None
+        self.canvas.delete("block_region")
+
+        x1, y1, x2, y2 = min(start_x, event.x), min(start_y, event.y), max(start_x, event.x), max(start_y, event.y)
+        selected_components = []
+        for instance in self.component_instances:
+            bounds = component_bounds(instance.x, instance.y, instance.rotation_angle)
+            if bounds[0] >= x1 and bounds[1] >= y1 and bounds[2] <= x2 and bounds[3] <= y2:
+                selected_components.append(instance)
+        if not selected_components:
+            tk.messagebox.showinfo("Define Block", "No components are inside the selected region.")
+            return
+
+        # Store the components relative to the center of the region, which the block rotates around
+        origin_x, origin_y = (x1 + x2) / 2, (y1 + y2) / 2
+        old_components = {block_instance: block_instance.components() for block_instance in self.block_instances
+                          if block_instance.block_name == block_name}
+        self.block_definitions[block_name] = {
+            "component_instances": [
+                {
+                    "id": instance.component_id,
+                    "symbol_name": instance.symbol_name,
+                    "x": instance.x - origin_x,
+                    "y": instance.y - origin_y,
+                    "rotation_angle": instance.rotation_angle,
+                }
+                for instance in selected_components
+            ],
+        }
+
+        # Replace the loose components with a placement of the block
+        for instance in selected_components:
+            self.canvas.delete(instance.item)
+            self.component_instances.remove(instance)
+        self.components_removed(selected_components)
+
+        # Update every existing placement of a redefined block
+        for block_instance, components in old_components.items():
+            self.components_removed(components)
+            block_instance.render()
+            self.components_changed(block_instance.components())
+
+        self.place_block(block_name, origin_x, origin_y)
+
+    def place_block_dialog(self):
+        # Ask for the name of a defined block and place it in the middle of the canvas
+        if not self.block_definitions:
+            tk.messagebox.showinfo("Place Block", "No blocks are defined yet. Use Define Block from Region first.")
+            return
+
+        block_name = simpledialog.askstring("Place Block", f"Block name ({', '.join(sorted(self.block_definitions))}):",
+                                            parent=self.root)
+        if block_name in self.block_definitions:
+            self.place_block(block_name, self.canvas.winfo_width() / 2, self.canvas.winfo_height() / 2)
+        elif block_name:
+            tk.messagebox.showinfo("Place Block", f"There is no block named '{block_name}'.")
+
+    def place_block(self, block_name, x, y, block_id=None, rotation_angle=0):
+        # Place a block on the canvas and check its components
+        block_instance = BlockInstance(self.canvas, block_name, x, y, self, block_id, rotation_angle)
+        self.block_instances.append(block_instance)
+        self.components_changed(block_instance.components())
+        return block_instance
+
+    def route_wire(self, start_pin, end_pin):
+        # Route a wire between two pins around the placed components and draw it
+        self.canvas.delete("route_marker")
+        self.route_start = None
+
+        # Clicking the same pin twice leaves nothing to connect
+        if start_pin == end_pin:
+            return
+
+        router = WireRouter(self.design_rule_checker.spatial_index, (self.canvas_width, self.canvas_height))
+        points = router.route(start_pin, end_pin)
+        if points is None:
+            tk.messagebox.showinfo("Route Wire", "No route found between the selected pins.")
+            return
+        if len(points) < 2:
+            return
+
+        self.wires.append(RoutedWire(self.canvas, points))
 
     def draw_grid(self, event=None):
         # Draw grid lines on the canvas if grid is enabled
@@ -363,19 +616,13 @@ class SchematicDesigner:
             for i in range(0, canvas_width, 20):
                 self.canvas.create_line(i, 0, i, canvas_height, fill="gray", tags="grid_line")
 
-    def save(self):
-        # Prompt the user for the file name and location
-        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
-
-        # Check if the user canceled the file dialog
-        if not file_path:
-            return
-
-        # Save schematic data to the chosen JSON file
-        save_data = {
+    def get_save_data(self):
+        # Collect the canvas size and component instances in the format written by save
+        return {
             "canvas_size": (self.canvas_width, self.canvas_height),
             "component_instances": [
                 {
+                    "id": instance.component_id,  # Stable id used to match components across versions
                     "symbol_name": instance.symbol_name,
                     "x": self.canvas.coords(instance.item)[0],  # Get the current x-coordinate
                     "y": self.canvas.coords(instance.item)[1],  # Get the current y-coordinate
@@ -383,10 +630,22 @@ class SchematicDesigner:
                 }
                 for instance in self.component_instances
             ],
+            "wires": [wire.to_save_data() for wire in self.wires],
+            "block_definitions": self.block_definitions,
+            "block_instances": [block_instance.to_save_data() for block_instance in self.block_instances],
         }
 
+    def save(self):
+        # Prompt the user for the file name and location
+        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+
+        # Check if the user canceled the file dialog
+        if not file_path:
+            return
+
+        # Save schematic data to the chosen JSON file
         with open(file_path, "w") as file:
-            json.dump(save_data, file)
+            json.dump(self.get_save_data(), file)
 
     def export_as_png(self):
         # Create an empty image with the same size as the canvas
@@ -406,16 +665,159 @@ class SchematicDesigner:
         if file_path:
             image.save(file_path, "PNG")
 
+    def export_as_svg(self):
+        # Ask user for the file path and write the components as an SVG file
+        file_path = filedialog.asksaveasfilename(defaultextension=".svg", filetypes=[("SVG files", "*.svg")])
+
+        if file_path:
+            VectorExporter(self.get_save_data()).export_svg(file_path)
+
+    def export_as_pdf(self):
+        # Ask user for the file path and write the components as a PDF file
+        file_path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF files", "*.pdf")])
+
+        if file_path:
+            VectorExporter(self.get_save_data()).export_pdf(file_path)
+
     def open_file(self):
         # Open a JSON file dialog and load data from the selected file
         file_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
         if file_path:
             self.load_from_file(file_path)
 
+    def browse_schematics(self):
+        # Ask for a directory and show previews of its JSON files, opening the one clicked
+        directory = filedialog.askdirectory()
+        if directory:
+            if self.thumbnail_cache is None:
+                self.thumbnail_cache = ThumbnailCache()
+            PreviewBrowser(self.root, directory, self.thumbnail_cache, self.load_from_file)
+
+    def exit_application(self):
+        # Save the thumbnail index and stop its background pool before quitting
+        if self.thumbnail_cache is not None:
+            self.thumbnail_cache.shutdown()
+            self.thumbnail_cache = None
+        self.root.quit()
+
+    def compare_with_file(self):
+        # Compare the canvas with a saved JSON file and outline the differences
+        file_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
+        if not file_path:
+            return
+
+        self.clear_comparison()
+        schematic_diff = SchematicDiff(read_schematic(file_path), self.get_save_data())
+        if schematic_diff.is_empty():
+            tk.messagebox.showinfo("Compare With", "The canvas has the same components as the saved file.")
+            return
+
+        # Outline components added since the saved file in green
+        for new in schematic_diff.added:
+            self.canvas.create_rectangle(*component_bounds(new["x"], new["y"], new.get("rotation_angle", 0)),
+                                         outline="green", width=2, tags="diff_overlay")
+
+        # Outline moved, rotated or replaced components in orange, with their old position dashed
+        for old, new in schematic_diff.moved + schematic_diff.rotated + schematic_diff.replaced:
+            self.canvas.create_rectangle(*component_bounds(new["x"], new["y"], new.get("rotation_angle", 0)),
+                                         outline="orange", width=2, tags="diff_overlay")
+            self.canvas.create_rectangle(*component_bounds(old["x"], old["y"], old.get("rotation_angle", 0)),
+                                         outline="orange", dash=(4, 2), tags="diff_overlay")
+
+        # Outline the old position of removed components in red
+        for old in schematic_diff.removed:
+            self.canvas.create_rectangle(*component_bounds(old["x"], old["y"], old.get("rotation_angle", 0)),
+                                         outline="red", dash=(4, 2), width=2, tags="diff_overlay")
+
+    def clear_comparison(self):
+        # Remove the comparison overlay from the canvas
+        self.canvas.delete("diff_overlay")
+
+    def components_changed(self, instances):
+        # Re-index and re-run the design rules around components that were added, moved or rotated
+        self.component_index.update_components(instances)
+        self.refresh_violation_markers(self.design_rule_checker.update_components(instances))
+
+    def components_removed(self, instances):
+        # Un-index and re-run the design rules around components that were deleted
+        component_ids = [instance.component_id for instance in instances]
+        self.component_index.remove_components(component_ids)
+        self.refresh_violation_markers(self.design_rule_checker.remove_components(component_ids))
+
+    def refresh_violation_markers(self, component_ids):
+        # Redraw the violation markers of the given components if markers are shown
+        for component_id in component_ids:
+            self.canvas.delete(f"drc_{component_id}")
+            if self.show_violations.get():
+                for violation in self.design_rule_checker.violations.get(component_id, []):
+                    self.canvas.create_rectangle(*violation.bounds, outline="red", width=2, dash=(2, 2),
+                                                 tags=("drc_marker", f"drc_{component_id}"))
+
+    def toggle_violation_markers(self):
+        # Show or hide the violation markers of all components
+        self.canvas.delete("drc_marker")
+        self.refresh_violation_markers(self.design_rule_checker.components)
+
+    def open_search_panel(self):
+        # Open the panel for finding components and editing them in bulk
+        SearchPanel(self.root, self)
+
+    def highlight_components(self, component_ids):
+        # Replace the search highlight with outlines around the given components
+        self.canvas.delete("query_highlight")
+        for component_id in component_ids:
+            component = self.component_index.components.get(component_id)
+            if component is None:
+                continue
+            self.canvas.create_rectangle(*component_bounds(component.x, component.y, component.rotation_angle),
+                                         outline="blue", width=2, tags="query_highlight")
+
+    def bulk_rotate(self, component_ids, rotation_angle):
+        # Rotate the loose components among the ids by the given angle, then check them in one batch
+        instances_by_id = {instance.component_id: instance for instance in self.component_instances}
+        selected_components = [instances_by_id[component_id] for component_id in component_ids
+                               if component_id in instances_by_id]
+
+        for instance in selected_components:
+            instance.set_rotation_angle(instance.rotation_angle + rotation_angle)
+
+        self.components_changed(selected_components)
+        return len(selected_components)
+
+    def bulk_delete(self, component_ids):
+        # Delete the loose components among the ids with a single canvas call
+        selected_components = [instance for instance in self.component_instances if instance.component_id in component_ids]
+        if selected_components:
+            self.canvas.delete(*[instance.item for instance in selected_components])
+
+        selected_ids = {instance.component_id for instance in selected_components}
+        self.component_instances = [instance for instance in self.component_instances
+                                    if instance.component_id not in selected_ids]
+        self.components_removed(selected_components)
+        self.reset_selection()
+        return len(selected_components)
+
+    def bulk_replace_symbol(self, component_ids, symbol_name):
+        # Replace the symbol of the loose components among the ids, then check them in one batch
+        instances_by_id = {instance.component_id: instance for instance in self.component_instances}
+        selected_components = [instances_by_id[component_id] for component_id in component_ids
+                               if component_id in instances_by_id]
+
+        for instance in selected_components:
+            instance.replace_symbol(symbol_name)
+
+        self.components_changed(selected_components)
+        return len(selected_components)
+
     def reset_canvas(self):
         # Reset the canvas by deleting all items and clearing component instances
         self.canvas.delete("all")
         self.component_instances = []
+        self.wires = []
+        self.route_start = None
+        self.block_definitions, self.block_instances = {}, []
+        self.design_rule_checker.reset()
+        self.component_index.reset()
 
     def load_from_file(self, filename):
         # Load schematic data from a JSON file and create component instances on the canvas
@@ -425,14 +827,16 @@ class SchematicDesigner:
         with open(filename, "r") as file:
             data = json.load(file)
 
-            for instance_data in data.get("component_instances", []):
+            for index, instance_data in enumerate(data.get("component_instances", [])):
                 symbol_name = instance_data.get("symbol_name")
                 x = instance_data.get("x")
                 y = instance_data.get("y")
                 rotation_angle = instance_data.get("rotation_angle", 0)  # Default to 0 if not present
+                # Files saved before ids existed are identified by list position, as in components_by_id
+                component_id = instance_data.get("id") or f"#{index}"
 
                 if symbol_name and x is not None and y is not None:
-                    component_instance = ComponentInstance(self.canvas, symbol_name, x, y, self)
+                    component_instance = ComponentInstance(self.canvas, symbol_name, x, y, self, component_id)
                     component_instance.rotation_angle = rotation_angle  # Set the rotation angle
 
                     # Rotate the image for the loaded component
@@ -446,6 +850,32 @@ class SchematicDesigner:
                     # Append the new component instance to the list
                     self.component_instances.append(component_instance)
 
+            # Place the blocks from their shared definitions
+            # Placements of unknown blocks are kept so that saving does not lose them
+            self.block_definitions = data.get("block_definitions", {})
+            unknown_blocks = set()
+            for block_data in data.get("block_instances", []):
+                if block_data.get("block_name") not in self.block_definitions:
+                    unknown_blocks.add(str(block_data.get("block_name")))
+                self.block_instances.append(BlockInstance(self.canvas, block_data.get("block_name"), block_data["x"],
+                                                          block_data["y"], self, block_data.get("id"),
+                                                          block_data.get("rotation_angle", 0)))
+
+            # Draw the routed wires, skipping wires too short to be drawn as a line
+            for wire_data in data.get("wires", []):
+                if len(wire_data.get("points") or []) < 2:
+                    print(f"Warning: Skipping wire {wire_data.get('id')} with fewer than two points")
+                    continue
+                self.wires.append(RoutedWire(self.canvas, wire_data["points"], wire_data.get("id")))
+
+        # Check the loaded components in a single batch
+        self.components_changed(self.component_instances + [component for block_instance in self.block_instances
+                                                            for component in block_instance.components()])
+
+        if unknown_blocks:
+            tk.messagebox.showwarning("Open", "The file places blocks without a definition, which are not drawn: "
+                                              f"{', '.join(sorted(unknown_blocks))}")
+
     def open_user_guide(self):
         # Open a user guide dialog to display information about the Schematic Designer
         user_guide_dialog = UserGuideDialog(self.root)
@@ -457,20 +887,30 @@ class SchematicDesigner:
 
         if result is not None:
             new_width, new_height = result
+            self.canvas_width, self.canvas_height = new_width, new_height
             self.canvas.config(width=new_width, height=new_height)
 
+            # Components outside the new bounds are design rule violations
+            self.design_rule_checker.set_canvas_size(result)
+            self.refresh_violation_markers(self.design_rule_checker.components)
+
     def clear_canvas(self):
-        # Clear the canvas, disable grid, reset tool states, and update tool buttons
-        self.canvas.delete("all")
+        # Clear the canvas and everything tracked for it, disable grid, reset tool states, and update tool buttons
+        self.reset_canvas()
+        self.reset_selection()
         self.grid_enabled = False
         self.selection_active = False
         self.rotation_enabled = False
         self.delete_enabled = False
+        self.routing_enabled = False
         self.update_tool_state()
 
     def draw(self, event):
         # Draw based on the selected tool (e.g., move or grid)
-        if self.selected_tool == "move.png":
+        if self.block_region_start is not None:
+            # Resize the region of a new block definition
+            self.canvas.coords("block_region", *self.block_region_start, event.x, event.y)
+        elif self.selected_tool == "move.png":
             self.draw_move_tool(event)
         elif self.selected_tool == "grid.png":
             self.draw_grid(event)
@@ -479,9 +919,23 @@ class SchematicDesigner:
         # Move the selected item on the canvas if the move tool is active
         if self.selected_item and self.prev_x is not None and self.prev_y is not None:
             delta_x, delta_y = event.x - self.prev_x, event.y - self.prev_y
-            self.canvas.move(self.selected_item, delta_x, delta_y)
             self.prev_x, self.prev_y = event.x, event.y
 
+            # Move every item of a placed block together
+            block_instance = self.get_block_instance_by_item(self.selected_item)
+            if block_instance:
+                block_instance.move(delta_x, delta_y)
+                self.components_changed(block_instance.components())
+                return
+
+            self.canvas.move(self.selected_item, delta_x, delta_y)
+
+            # Keep the component position in sync for the design rule checker
+            selected_component = self.get_component_instance_by_item(self.selected_item)
+            if selected_component:
+                selected_component.x, selected_component.y = self.canvas.coords(self.selected_item)
+                self.components_changed([selected_component])
+
     def draw_move_tool_start(self, event):
         # Initialize the starting coordinates when the move tool is activated
         if self.selection_active and self.selected_tool == "move.png":
@@ -493,6 +947,7 @@ class SchematicDesigner:
         self.tool_buttons["move.png"].state(('pressed',) if self.selection_active else ('!pressed',))
         self.tool_buttons["rotate.png"].state(('pressed',) if self.rotation_enabled else ('!pressed',))
         self.tool_buttons["delete.png"].state(('pressed',) if self.delete_enabled else ('!pressed',))
+        self.tool_buttons["draw.png"].state(('pressed',) if self.routing_enabled else ('!pressed',))
 
 if __name__ == "__main__":
     # Create the main Tkinter window and run the Schematic Designer application
@@ -0,0 +1,121 @@
+import os
+import tkinter as tk
+from tkinter import ttk
+from PIL import ImageTk
+
+class PreviewBrowser(tk.Toplevel):
+    """
+    PreviewBrowser shows thumbnails of every schematic file in a directory.
+
+    Thumbnails come from a ThumbnailCache and are rendered on its background pool;
+    the browser polls for finished thumbnails so Tk is only touched from the main thread.
+    Clicking a preview opens that file.
+
+    Attributes:
+        parent (tk.Tk): The parent Tkinter window for the dialog.
+        directory (str): The directory being browsed.
+        thumbnail_cache (ThumbnailCache): The cache providing the thumbnails.
+        on_open (callable): Called with the path of the chosen file.
+
+    Methods:
+        __init__(parent, directory, thumbnail_cache, on_open): Constructor method.
+            Initializes the browser and requests a thumbnail for each file.
+
+        poll_thumbnails(): Shows thumbnails that have finished rendering.
+
+        open_schematic(file_path): Opens the chosen file and closes the browser.
+
+        close(): Saves the thumbnail index and closes the browser.
+    """
+
+    COLUMNS = 4
+
+    def __init__(self, parent, directory, thumbnail_cache, on_open):
+        """
+        Initialize the browser and request a thumbnail for each file.
+
+        Parameters:
+            parent (tk.Tk): The parent Tkinter window for the dialog.
+            directory (str): The directory to browse.
+            thumbnail_cache (ThumbnailCache): The cache providing the thumbnails.
+            on_open (callable): Called with the path of the chosen file.
+        """
+        super().__init__(parent)
+        self.title(f"Browse Schematics - {directory}")
+        self.directory = directory
+        self.thumbnail_cache = thumbnail_cache
+        self.on_open = on_open
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Scrollable frame holding the preview grid
+        scroll_canvas = tk.Canvas(self, width=720, height=480, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=scroll_canvas.yview)
+        scroll_canvas.configure(yscrollcommand=scrollbar.set)
+        scroll_canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        self.preview_frame = ttk.Frame(scroll_canvas)
+        scroll_canvas.create_window(0, 0, window=self.preview_frame, anchor=tk.NW)
+        self.preview_frame.bind("<Configure>", lambda event: scroll_canvas.configure(scrollregion=scroll_canvas.bbox("all")))
+
+        # Create a placeholder for each file and request its thumbnail
+        self.pending = {}
+        self.preview_images = {}
+        file_names = sorted(name for name in os.listdir(directory) if name.lower().endswith(".json"))
+
+        for index, file_name in enumerate(file_names):
+            file_path = os.path.join(directory, file_name)
+            tile = ttk.Frame(self.preview_frame, padding=5)
+            tile.grid(row=index // self.COLUMNS, column=index % self.COLUMNS, sticky="n")
+
+            image_label = ttk.Label(tile, text="Loading...", width=20, anchor="center")
+            image_label.pack()
+            name_label = ttk.Label(tile, text=file_name)
+            name_label.pack()
+
+            for widget in (tile, image_label, name_label):
+                widget.bind("<Button-1>", lambda event, p=file_path: self.open_schematic(p))
+
+            self.pending[image_label] = self.thumbnail_cache.request_thumbnail(file_path)
+
+        self.poll_thumbnails()
+
+    def poll_thumbnails(self):
+        """
+        Shows thumbnails that have finished rendering.
+        """
+        for image_label, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[image_label]
+                # A file that failed to render must not stop the remaining previews
+                thumbnail = None if future.cancelled() or future.exception() else future.result()
+
+                if thumbnail:
+                    # Keep a reference to the image so it is not garbage collected
+                    self.preview_images[image_label] = ImageTk.PhotoImage(thumbnail)
+                    image_label.config(image=self.preview_images[image_label], text="", width=0)
+                else:
+                    image_label.config(text="No preview")
+
+        if self.pending:
+            self.after(50, self.poll_thumbnails)
+
+    def open_schematic(self, file_path):
+        """
+        Opens the chosen file and closes the browser.
+
+        Parameters:
+            file_path (str): Path of the chosen schematic file.
+        """
+        self.close()
+        self.on_open(file_path)
+
+    def close(self):
+        """
+        Saves the thumbnail index and closes the browser.
+        """
+        for future in self.pending.values():
+            future.cancel()
+        self.pending = {}
+        self.thumbnail_cache.save_index()
+        self.destroy()
@@ -0,0 +1,39 @@
+import uuid
+
+class RoutedWire:
+    """
+    Represents a routed wire on the canvas in a schematic designer tool.
+
+    Unlike the wire symbol, a routed wire is a single polyline canvas item rather
+    than a rotated image per segment.
+
+    Attributes:
+        canvas (tk.Canvas): The canvas where the wire is displayed.
+        points (list): The (x, y) corner points of the wire.
+        wire_id (str): Stable identifier of the wire, kept across save and load.
+        item (int): The item ID representing the wire on the canvas.
+
+    Methods:
+        __init__(self, canvas, points, wire_id=None): Constructor method.
+            Initializes the wire and draws it on the canvas.
+
+        to_save_data(self): Returns the wire in the format written by SchematicDesigner.save.
+    """
+
+    def __init__(self, canvas, points, wire_id=None):
+        self.canvas = canvas
+        self.points = [tuple(point) for point in points]
+        self.wire_id = wire_id or uuid.uuid4().hex
+
+        # Flatten the points into the coordinate list expected by create_line
+        coordinates = [coordinate for point in self.points for coordinate in point]
+        self.item = self.canvas.create_line(*coordinates, fill="black", width=2, tags=("clickable", "routed_wire"))
+
+    def to_save_data(self):
+        """
+        Returns the wire in the format written by SchematicDesigner.save.
+
+        Returns:
+            dict: The wire id and its corner points.
+        """
+        return {"id": self.wire_id, "points": [list(point) for point in self.points]}
@@ -0,0 +1,313 @@
+import argparse
+import json
+import sys
+from .schematic_file import read_schematic, iter_component_instances
+
+# Fields of a saved component instance that are compared and merged
+# A tuple of keys is merged as a single value, so that two different moves conflict
+COMPONENT_FIELDS = ("symbol_name", ("x", "y"), "rotation_angle")
+
+# Fields of placed blocks and routed wires that are merged
+BLOCK_FIELDS = ("block_name", ("x", "y"), "rotation_angle")
+WIRE_FIELDS = ("points",)
+
+# Marker returned by _merge_value when both sides changed a value differently
+_CONFLICT = object()
+
+class SchematicDiff:
+    """
+    Structural differences between two versions of a schematic.
+
+    Components are matched by their stable "id", so the comparison is a single
+    pass over each component list regardless of the order components were saved in.
+    Placed blocks are expanded, so editing a block definition reports every
+    component it changed in each placement.
+    A component that was both moved and rotated appears in both lists.
+
+    Attributes:
+        added (list): Component instances only present in the new version.
+        removed (list): Component instances only present in the old version.
+        moved (list): (old, new) pairs of component instances whose position changed.
+        rotated (list): (old, new) pairs of component instances whose rotation angle changed.
+        replaced (list): (old, new) pairs of component instances whose symbol changed.
+
+    Methods:
+        __init__(self, old_data, new_data): Constructor method.
+            Compares the component instances of two save data dictionaries.
+
+        is_empty(self): Returns True if the two versions have the same components.
+
+        format(self): Returns the differences as human-readable lines.
+    """
+
+    def __init__(self, old_data, new_data):
+        """
+        Compare the component instances of two save data dictionaries.
+
+        Parameters:
+            old_data (dict): The save data of the old version.
+            new_data (dict): The save data of the new version.
+        """
+        old_components = components_by_id(old_data)
+        new_components = components_by_id(new_data)
+        self.added, self.removed, self.moved, self.rotated, self.replaced = [], [], [], [], []
+
+        for component_id, new in new_components.items():
+            old = old_components.get(component_id)
+            if old is None:
+                self.added.append(new)
+                continue
+
+            if (old.get("x"), old.get("y")) != (new.get("x"), new.get("y")):
+                self.moved.append((old, new))
+            if old.get("rotation_angle", 0) != new.get("rotation_angle", 0):
+                self.rotated.append((old, new))
+            if old.get("symbol_name") != new.get("symbol_name"):
+                self.replaced.append((old, new))
+
+        self.removed = [old for component_id, old in old_components.items() if component_id not in new_components]
+
+    def is_empty(self):
+        """
+        Returns True if the two versions have the same components.
+        """
+        return not (self.added or self.removed or self.moved or self.rotated or self.replaced)
+
+    def format(self):
+        """
+        Returns the differences as human-readable lines.
+
+        Returns:
+            list: One line per change.
+        """
+        lines = [f"+ {new['id']} {new.get('symbol_name')} at ({new.get('x')}, {new.get('y')})" for new in self.added]
+        lines += [f"- {old['id']} {old.get('symbol_name')} at ({old.get('x')}, {old.get('y')})" for old in self.removed]
+        lines += [f"~ {new['id']} moved ({old.get('x')}, {old.get('y')}) -> ({new.get('x')}, {new.get('y')})"
+                  for old, new in self.moved]
+        lines += [f"~ {new['id']} rotated {old.get('rotation_angle', 0)} -> {new.get('rotation_angle', 0)}"
+                  for old, new in self.rotated]
+        lines += [f"~ {new['id']} replaced {old.get('symbol_name')} -> {new.get('symbol_name')}"
+                  for old, new in self.replaced]
+        return lines
+
+
+class MergeConflict:
+    """
+    A field changed differently on both sides of a three-way merge.
+
+    Attributes:
+        component_id (str): The id of the conflicting entry, the block name for block definitions,
+            or None for the canvas size.
+        field (str): The conflicting field ("x,y" for the position), "deleted" when one side removed a component the other changed,
+            or "block_definition" when a placed block's definition was removed.
+        base: The value in the common ancestor.
+        ours: The value in our version (kept in the merged result).
+        theirs: The value in their version.
+    """
+
+    def __init__(self, component_id, field, base, ours, theirs):
+        self.component_id = component_id
+        self.field = field
+        self.base = base
+        self.ours = ours
+        self.theirs = theirs
+
+    def __str__(self):
+        target = self.component_id or "canvas"
+        return f"! {target} {self.field}: base={self.base!r} ours={self.ours!r} theirs={self.theirs!r}"
+
+
+def components_by_id(save_data):
+    """
+    Returns the component instances of save data keyed by their stable id.
+
+    Placed blocks are expanded, so their components are keyed as "block id/component id".
+    Components saved before ids were introduced are keyed by their list position.
+
+    Parameters:
+        save_data (dict): The save data of a schematic.
+
+    Returns:
+        dict: Mapping of id -> component instance dictionary (with "id" set).
+    """
+    return _entities_by_id(iter_component_instances(save_data))
+
+
+def merge_schematics(base_data, our_data, their_data):
+    """
+    Merges two versions of a schematic that share a common ancestor.
+
+    Loose components, placed blocks and routed wires are matched by id and each
+    field is merged independently: a change on one side is taken, the same
+    change on both sides is taken once, and different changes on both sides are
+    reported as a conflict with our value kept. An entry removed on one side
+    and modified on the other is kept and reported as a conflict. Block
+    definitions are merged as a whole by name; a definition removed on one side
+    while the other side still places the block is kept and reported as a conflict.
+
+    Parameters:
+        base_data (dict): The save data of the common ancestor.
+        our_data (dict): The save data of our version.
+        their_data (dict): The save data of their version.
+
+    Returns:
+        tuple: The merged save data and a list of MergeConflict.
+    """
+    conflicts = []
+
+    canvas_size = _merge_value(base_data.get("canvas_size"), our_data.get("canvas_size"), their_data.get("canvas_size"))
+    if canvas_size is _CONFLICT:
+        conflicts.append(MergeConflict(None, "canvas_size", base_data.get("canvas_size"),
+                                       our_data.get("canvas_size"), their_data.get("canvas_size")))
+        canvas_size = our_data.get("canvas_size")
+
+    merged_data = dict(our_data, canvas_size=canvas_size)
+    for key, fields in (("component_instances", COMPONENT_FIELDS), ("block_instances", BLOCK_FIELDS),
+                        ("wires", WIRE_FIELDS)):
+        merged_data[key] = _merge_entities(_entities_by_id(base_data.get(key, [])),
+                                           _entities_by_id(our_data.get(key, [])),
+                                           _entities_by_id(their_data.get(key, [])), fields, conflicts)
+
+    # Block definitions are matched by name and merged as a whole
+    base_definitions = base_data.get("block_definitions", {})
+    our_definitions = our_data.get("block_definitions", {})
+    their_definitions = their_data.get("block_definitions", {})
+    merged_definitions = {}
+
+    for block_name in dict.fromkeys(list(base_definitions) + list(our_definitions) + list(their_definitions)):
+        base, ours, theirs = base_definitions.get(block_name), our_definitions.get(block_name), their_definitions.get(block_name)
+        definition = _merge_value(base, ours, theirs)
+        if definition is _CONFLICT:
+            conflicts.append(MergeConflict(block_name, "block_definition", base, ours, theirs))
+            definition = ours if ours is not None else theirs
+        if definition is not None:
+            merged_definitions[block_name] = definition
+
+    # Every merged placement must still have its definition
+    for block_data in merged_data["block_instances"]:
+        block_name = block_data.get("block_name")
+        if block_name in merged_definitions:
+            continue
+
+        conflicts.append(MergeConflict(block_data["id"], "block_definition",
+                                       *[block_name if block_name in definitions else "deleted"
+                                         for definitions in (base_definitions, our_definitions, their_definitions)]))
+        for definitions in (our_definitions, their_definitions, base_definitions):
+            if block_name in definitions:
+                merged_definitions[block_name] = definitions[block_name]
+                break
+
+    merged_data["block_definitions"] = merged_definitions
+    return merged_data, conflicts
+
+
+def _entities_by_id(entities):
+    # Key saved entries by their id, falling back to their list position
+    keyed = {}
+    for index, entity in enumerate(entities):
+        entity_id = entity.get("id") or f"#{index}"
+        keyed[entity_id] = dict(entity, id=entity_id)
+    return keyed
+
+
+def _merge_entities(base_entities, our_entities, their_entities, fields, conflicts):
+    # Three-way merge of entries keyed by id, appending any conflicts found
+    # Keep the base order, followed by entries added on our side and then their side
+    ordered_ids = dict.fromkeys(list(base_entities) + list(our_entities) + list(their_entities))
+    merged_entities = []
+
+    for entity_id in ordered_ids:
+        base = base_entities.get(entity_id)
+        ours = our_entities.get(entity_id)
+        theirs = their_entities.get(entity_id)
+
+        if base is None:
+            # Added on one or both sides
+            if ours and theirs and ours != theirs:
+                conflicts.append(MergeConflict(entity_id, "added", None, ours, theirs))
+            merged_entities.append(ours or theirs)
+        elif ours is None and theirs is None:
+            continue
+        elif ours is None or theirs is None:
+            # Removed on one side: drop it unless the other side changed it
+            remaining = ours or theirs
+            if remaining != base:
+                conflicts.append(MergeConflict(entity_id, "deleted", base,
+                                               "deleted" if ours is None else ours,
+                                               "deleted" if theirs is None else theirs))
+                merged_entities.append(remaining)
+        elif ours == theirs or theirs == base:
+            merged_entities.append(ours)
+        elif ours == base:
+            merged_entities.append(theirs)
+        else:
+            merged = {"id": entity_id}
+            for field in fields:
+                keys = field if isinstance(field, tuple) else (field,)
+                base_value, our_value, their_value = (tuple(entity.get(key) for key in keys)
+                                                      for entity in (base, ours, theirs))
+                value = _merge_value(base_value, our_value, their_value)
+                if value is _CONFLICT:
+                    # Report single fields as plain values and grouped fields as tuples
+                    reported = [side if len(keys) > 1 else side[0] for side in (base_value, our_value, their_value)]
+                    conflicts.append(MergeConflict(entity_id, ",".join(keys), *reported))
+                    value = our_value
+                merged.update(zip(keys, value))
+            merged_entities.append(merged)
+
+    return merged_entities
+
+
+def _merge_value(base, ours, theirs):
+    # Three-way merge of a single value
+    if ours == theirs or theirs == base:
+        return ours
+    if ours == base:
+        return theirs
+    return _CONFLICT
+
+
+def main(argv=None):
+    """
+    Command line entry point for comparing and merging schematic files.
+
+    Usage:
+        python -m schematic_designer.schematic_diff diff OLD NEW
+        python -m schematic_designer.schematic_diff merge BASE OURS THEIRS -o OUTPUT
+
+    Returns:
+        int: 0 on success, 1 if the files differ or the merge had conflicts.
+    """
+    parser = argparse.ArgumentParser(prog="schematic_diff", description="Compare and merge schematic files.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    diff_parser = subparsers.add_parser("diff", help="List components added, removed, moved or rotated.")
+    diff_parser.add_argument("old")
+    diff_parser.add_argument("new")
+
+    merge_parser = subparsers.add_parser("merge", help="Three-way merge of two edited versions.")
+    merge_parser.add_argument("base")
+    merge_parser.add_argument("ours")
+    merge_parser.add_argument("theirs")
+    merge_parser.add_argument("-o", "--output", required=True)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "diff":
+        schematic_diff = SchematicDiff(read_schematic(args.old), read_schematic(args.new))
+        for line in schematic_diff.format():
+            print(line)
+        return 0 if schematic_diff.is_empty() else 1
+
+    merged_data, conflicts = merge_schematics(read_schematic(args.base), read_schematic(args.ours),
+                                              read_schematic(args.theirs))
+    with open(args.output, "w") as file:
+        json.dump(merged_data, file)
+
+    for conflict in conflicts:
+        print(conflict)
+    return 1 if conflicts else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
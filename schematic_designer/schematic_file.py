@@ -0,0 +1,192 @@
+import json
+import math
+from collections import namedtuple
+
+# Directory containing component symbols and the size they are drawn at on the canvas
+SYMBOL_DIRECTORY = "assets/component_symbols/"
+SYMBOL_SIZE = (120, 60)
+
+# Lightweight, read-only view of a saved component instance
+ComponentRecord = namedtuple("ComponentRecord", ["component_id", "symbol_name", "x", "y", "rotation_angle"])
+
+
+def read_schematic(filename):
+    """
+    Reads the save data of a schematic from a JSON file.
+
+    Parameters:
+        filename (str): Path of the JSON file written by SchematicDesigner.save.
+
+    Returns:
+        dict: The save data, with "canvas_size" and "component_instances" always present.
+
+    Raises:
+        ValueError: If the file is not valid JSON or does not have the layout of a schematic.
+    """
+    with open(filename, "r") as file:
+        data = json.load(file)
+
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+
+    canvas_size = data.get("canvas_size", (800, 600))
+    if (not isinstance(canvas_size, (list, tuple)) or len(canvas_size) != 2
+            or not all(isinstance(value, (int, float)) and value > 0 for value in canvas_size)):
+        raise ValueError(f"Invalid canvas size {canvas_size!r}")
+    data["canvas_size"] = tuple(canvas_size)
+
+    # Every list of saved entries must only hold objects
+    data.setdefault("component_instances", [])
+    for key in ("component_instances", "block_instances", "wires"):
+        entries = data.get(key, [])
+        if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+            raise ValueError(f"Expected a list of objects for '{key}'")
+    if not isinstance(data.get("block_definitions", {}), dict):
+        raise ValueError("Expected an object for 'block_definitions'")
+    return data
+
+
+def rotated_size(rotation_angle):
+    """
+    Returns the size of a symbol after it has been rotated.
+
+    Mirrors PIL's Image.rotate(angle, expand=True), which is how symbols are rotated on the canvas.
+
+    Parameters:
+        rotation_angle (int): The rotation angle of the symbol (in degrees, counterclockwise).
+
+    Returns:
+        tuple: The (width, height) of the rotated symbol.
+    """
+    width, height = SYMBOL_SIZE
+    angle = math.radians(rotation_angle)
+    cos_a, sin_a = round(math.cos(angle), 15), round(math.sin(angle), 15)
+
+    # Rotate the corners around the center and measure their extent
+    xs, ys = [], []
+    for corner_x, corner_y in ((-width / 2, -height / 2), (width / 2, -height / 2),
+                               (width / 2, height / 2), (-width / 2, height / 2)):
+        xs.append(corner_x * cos_a + corner_y * sin_a)
+        ys.append(-corner_x * sin_a + corner_y * cos_a)
+
+    return (math.ceil(max(xs)) - math.floor(min(xs)),
+            math.ceil(max(ys)) - math.floor(min(ys)))
+
+
+def component_bounds(x, y, rotation_angle):
+    """
+    Returns the bounding box of a component placed on the canvas.
+
+    Parameters:
+        x (float): The x-coordinate of the component's top-left anchor.
+        y (float): The y-coordinate of the component's top-left anchor.
+        rotation_angle (int): The rotation angle of the component (in degrees).
+
+    Returns:
+        tuple: The (x1, y1, x2, y2) bounding box of the rotated symbol.
+    """
+    rotated_width, rotated_height = rotated_size(rotation_angle)
+    return x, y, x + rotated_width, y + rotated_height
+
+
+def component_records(save_data):
+    """
+    Returns the saved component instances of a schematic as ComponentRecord tuples.
+
+    Placed blocks are expanded into their components. Components saved before ids
+    were introduced are identified by their list position.
+
+    Parameters:
+        save_data (dict): The save data of a schematic.
+
+    Returns:
+        list: The ComponentRecord of each valid component instance.
+    """
+    records = []
+    for index, instance_data in enumerate(iter_component_instances(save_data)):
+        if instance_data.get("symbol_name") and instance_data.get("x") is not None and instance_data.get("y") is not None:
+            records.append(ComponentRecord(instance_data.get("id") or f"#{index}", instance_data["symbol_name"],
+                                           instance_data["x"], instance_data["y"], instance_data.get("rotation_angle", 0)))
+    return records
+
+
+def symbol_pins(x, y, rotation_angle):
+    """
+    Returns the connection points of a component placed on the canvas.
+
+    Symbols are drawn with their leads along the horizontal center line, so the
+    pins are the middle of the left and right edges, rotated with the symbol.
+
+    Parameters:
+        x (float): The x-coordinate of the component's top-left anchor.
+        y (float): The y-coordinate of the component's top-left anchor.
+        rotation_angle (int): The rotation angle of the component (in degrees, counterclockwise).
+
+    Returns:
+        list: The (x, y) position of the left and right pins.
+    """
+    rotated_width, rotated_height = rotated_size(rotation_angle)
+    center_x, center_y = x + rotated_width / 2, y + rotated_height / 2
+    angle = math.radians(rotation_angle)
+    offset_x, offset_y = SYMBOL_SIZE[0] / 2 * math.cos(angle), -SYMBOL_SIZE[0] / 2 * math.sin(angle)
+    return [(center_x - offset_x, center_y - offset_y), (center_x + offset_x, center_y + offset_y)]
+
+
+def expand_block(block_data, definition):
+    """
+    Yields the component instances of a placed block in canvas coordinates.
+
+    Definition components are stored relative to the block origin, which is the
+    point the block is rotated around. Each component is rotated with the block
+    and keeps its own rotation on top of the block's.
+
+    Parameters:
+        block_data (dict): The placed block, with "id", "x", "y" and "rotation_angle" keys.
+        definition (dict): The block definition, with a "component_instances" list.
+
+    Yields:
+        dict: A component instance with "id" (block id/component id), "symbol_name", "x", "y" and "rotation_angle".
+    """
+    block_rotation = block_data.get("rotation_angle", 0)
+    angle = math.radians(block_rotation)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+
+    for index, instance_data in enumerate(definition.get("component_instances", [])):
+        rotation_angle = instance_data.get("rotation_angle", 0)
+        width, height = rotated_size(rotation_angle)
+        center_x, center_y = instance_data["x"] + width / 2, instance_data["y"] + height / 2
+
+        # Rotate the component center around the block origin (counterclockwise on screen)
+        rotated_x = center_x * cos_a + center_y * sin_a
+        rotated_y = -center_x * sin_a + center_y * cos_a
+
+        rotation_angle = (rotation_angle + block_rotation) % 360
+        width, height = rotated_size(rotation_angle)
+        yield {
+            "id": f"{block_data.get('id')}/{instance_data.get('id') or index}",
+            "symbol_name": instance_data.get("symbol_name"),
+            "x": block_data["x"] + rotated_x - width / 2,
+            "y": block_data["y"] + rotated_y - height / 2,
+            "rotation_angle": rotation_angle,
+        }
+
+
+def iter_component_instances(save_data):
+    """
+    Yields every component instance of a schematic, expanding placed blocks lazily.
+
+    Parameters:
+        save_data (dict): The save data of a schematic.
+
+    Yields:
+        dict: The loose component instances, followed by the components of each placed block.
+    """
+    yield from save_data.get("component_instances", [])
+
+    block_definitions = save_data.get("block_definitions", {})
+    for block_data in save_data.get("block_instances", []):
+        definition = block_definitions.get(block_data.get("block_name"))
+        if definition is None:
+            print(f"Warning: Unknown block {block_data.get('block_name')}")
+            continue
+        yield from expand_block(block_data, definition)
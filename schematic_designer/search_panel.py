@@ -0,0 +1,123 @@
+import os
+import tkinter as tk
+from tkinter import messagebox, ttk
+from .component_query import parse_query
+from .schematic_file import SYMBOL_DIRECTORY
+
+class SearchPanel(tk.Toplevel):
+    """
+    SearchPanel finds components with a query and applies bulk actions to the results.
+
+    Results are highlighted on the canvas. Actions are applied to every result
+    in a single batched canvas update by the schematic designer.
+
+    Attributes:
+        schematic_designer (SchematicDesigner): The parent schematic designer tool.
+        query_entry (ttk.Entry): Entry widget for the query text.
+        result_label (ttk.Label): Label showing the number of results or an error.
+        symbol_choice (ttk.Combobox): Symbol used by the replace action.
+        result_ids (set): The ids of the components found by the last search.
+
+    Methods:
+        __init__(parent, schematic_designer): Constructor method.
+            Initializes the panel widgets.
+
+        search(): Runs the query and highlights the results.
+
+        rotate_results(): Rotates the results by 45 degrees.
+
+        delete_results(): Deletes the results.
+
+        replace_results(): Replaces the symbol of the results.
+
+        close(): Removes the highlight and closes the panel.
+    """
+
+    def __init__(self, parent, schematic_designer):
+        """
+        Initialize the panel widgets.
+
+        Parameters:
+            parent (tk.Tk): The parent Tkinter window for the panel.
+            schematic_designer (SchematicDesigner): The schematic designer whose components are searched.
+        """
+        super().__init__(parent)
+        self.title("Find Components")
+        self.schematic_designer = schematic_designer
+        self.result_ids = set()
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        ttk.Label(self, text="e.g. symbol=capacitor rotation=45 region=0,0,400,300").grid(row=0, column=0, columnspan=4,
+                                                                                           padx=5, pady=5, sticky="w")
+        self.query_entry = ttk.Entry(self, width=50)
+        self.query_entry.grid(row=1, column=0, columnspan=3, padx=5, pady=5, sticky="ew")
+        self.query_entry.bind("<Return>", lambda event: self.search())
+        ttk.Button(self, text="Search", command=self.search).grid(row=1, column=3, padx=5, pady=5)
+
+        self.result_label = ttk.Label(self, text="")
+        self.result_label.grid(row=2, column=0, columnspan=4, padx=5, pady=5, sticky="w")
+
+        # Bulk actions on the results
+        ttk.Button(self, text="Rotate 45°", command=self.rotate_results).grid(row=3, column=0, padx=5, pady=5)
+        ttk.Button(self, text="Delete", command=self.delete_results).grid(row=3, column=1, padx=5, pady=5)
+
+        symbol_names = sorted(name for name in os.listdir(SYMBOL_DIRECTORY) if name.endswith(".png"))
+        self.symbol_choice = ttk.Combobox(self, values=symbol_names, state="readonly", width=15)
+        self.symbol_choice.grid(row=3, column=2, padx=5, pady=5)
+        ttk.Button(self, text="Replace Symbol", command=self.replace_results).grid(row=3, column=3, padx=5, pady=5)
+
+        self.query_entry.focus_set()
+
+    def search(self):
+        """
+        Runs the query and highlights the results.
+        """
+        try:
+            criteria = parse_query(self.query_entry.get())
+        except ValueError as e:
+            self.result_label.config(text=f"Error: {e}")
+            return
+
+        self.result_ids = self.schematic_designer.component_index.query(**criteria)
+        self.schematic_designer.highlight_components(self.result_ids)
+        self.result_label.config(text=f"{len(self.result_ids)} components found")
+
+    def rotate_results(self):
+        """
+        Rotates the results by 45 degrees.
+        """
+        self.report(self.schematic_designer.bulk_rotate(self.result_ids, 45), "rotated")
+        self.schematic_designer.highlight_components(self.result_ids)
+
+    def delete_results(self):
+        """
+        Deletes the results.
+        """
+        if self.result_ids and messagebox.askyesno("Confirmation", f"Delete {len(self.result_ids)} components?",
+                                                      parent=self):
+            self.report(self.schematic_designer.bulk_delete(self.result_ids), "deleted")
+            self.result_ids = set()
+            self.schematic_designer.highlight_components(self.result_ids)
+
+    def replace_results(self):
+        """
+        Replaces the symbol of the results.
+        """
+        if self.symbol_choice.get():
+            self.report(self.schematic_designer.bulk_replace_symbol(self.result_ids, self.symbol_choice.get()), "replaced")
+            self.schematic_designer.highlight_components(self.result_ids)
+
+    def report(self, edited_count, action):
+        # Show how many results were edited; components inside blocks are edited through their definition
+        skipped_count = len(self.result_ids) - edited_count
+        text = f"{edited_count} components {action}"
+        if skipped_count:
+            text += f" ({skipped_count} inside blocks skipped)"
+        self.result_label.config(text=text)
+
+    def close(self):
+        """
+        Removes the highlight and closes the panel.
+        """
+        self.schematic_designer.highlight_components(set())
+        self.destroy()
@@ -0,0 +1,171 @@
+class SpatialIndex:
+    """
+    Uniform grid index of axis-aligned bounding boxes.
+
+    Each key is stored in every grid cell its bounding box covers, so region and
+    point queries only look at the keys in the cells they touch instead of
+    comparing against every stored box.
+
+    Attributes:
+        cell_size (int): The width and height of a grid cell.
+
+    Methods:
+        __init__(self, cell_size): Constructor method.
+            Initializes an empty index.
+
+        insert(self, key, bounds): Adds or replaces the bounding box of a key.
+
+        remove(self, key): Removes a key from the index.
+
+        bounds(self, key): Returns the bounding box of a key, or None.
+
+        query(self, bounds): Returns the keys whose bounding box intersects the given box.
+
+        query_point(self, x, y): Returns the keys whose bounding box contains the given point.
+
+        estimate_count(self, bounds): Returns an estimate of how many keys a query of the given box looks at.
+
+        clear(self): Removes every key.
+    """
+
+    def __init__(self, cell_size=120):
+        """
+        Initialize an empty index.
+
+        Parameters:
+            cell_size (int): The width and height of a grid cell.
+        """
+        self.cell_size = cell_size
+        self.clear()
+
+    def __len__(self):
+        return len(self.key_bounds)
+
+    def __contains__(self, key):
+        return key in self.key_bounds
+
+    def insert(self, key, bounds):
+        """
+        Adds or replaces the bounding box of a key.
+
+        Parameters:
+            key: The key to store, e.g. a component id.
+            bounds (tuple): The (x1, y1, x2, y2) bounding box.
+        """
+        if key in self.key_bounds:
+            self.remove(key)
+
+        self.key_bounds[key] = bounds
+        for cell in self._cells(bounds):
+            self.cells.setdefault(cell, set()).add(key)
+            self.entry_count += 1
+
+    def remove(self, key):
+        """
+        Removes a key from the index.
+
+        Parameters:
+            key: The key to remove. Unknown keys are ignored.
+        """
+        bounds = self.key_bounds.pop(key, None)
+        if bounds is None:
+            return
+
+        for cell in self._cells(bounds):
+            keys = self.cells.get(cell)
+            if keys is not None and key in keys:
+                keys.discard(key)
+                self.entry_count -= 1
+                if not keys:
+                    del self.cells[cell]
+
+    def bounds(self, key):
+        """
+        Returns the bounding box of a key, or None if it is not indexed.
+        """
+        return self.key_bounds.get(key)
+
+    def query(self, bounds):
+        """
+        Returns the keys whose bounding box intersects the given box.
+
+        Boxes that only touch along an edge are included. A box covering more grid
+        cells than are occupied, such as the whole canvas, only visits the occupied cells.
+
+        Parameters:
+            bounds (tuple): The (x1, y1, x2, y2) box to search.
+
+        Returns:
+            set: The matching keys.
+        """
+        x1, y1, x2, y2 = bounds
+        cell_x1, cell_y1, cell_x2, cell_y2 = self._cell_range(bounds)
+        candidates = set()
+        if (cell_x2 - cell_x1 + 1) * (cell_y2 - cell_y1 + 1) > len(self.cells):
+            for (cell_x, cell_y), keys in self.cells.items():
+                if cell_x1 <= cell_x <= cell_x2 and cell_y1 <= cell_y <= cell_y2:
+                    candidates.update(keys)
+        else:
+            for cell in self._cells(bounds):
+                candidates.update(self.cells.get(cell, ()))
+
+        matches = set()
+        for key in candidates:
+            key_x1, key_y1, key_x2, key_y2 = self.key_bounds[key]
+            if key_x1 <= x2 and x1 <= key_x2 and key_y1 <= y2 and y1 <= key_y2:
+                matches.add(key)
+        return matches
+
+    def query_point(self, x, y):
+        """
+        Returns the keys whose bounding box contains the given point.
+
+        Parameters:
+            x (float): The x-coordinate of the point.
+            y (float): The y-coordinate of the point.
+
+        Returns:
+            set: The matching keys.
+        """
+        return self.query((x, y, x, y))
+
+    def estimate_count(self, bounds):
+        """
+        Returns an estimate of how many keys a query of the given box looks at.
+
+        The estimate is the number of grid cells the box covers, at most the number
+        of occupied cells, times the mean number of keys per occupied cell, so it is
+        computed without visiting any cell.
+
+        Parameters:
+            bounds (tuple): The (x1, y1, x2, y2) box to search.
+
+        Returns:
+            float: The estimated number of keys, at most the number of stored keys.
+        """
+        if not self.cells:
+            return 0
+        cell_x1, cell_y1, cell_x2, cell_y2 = self._cell_range(bounds)
+        covered_cells = min(len(self.cells), (cell_x2 - cell_x1 + 1) * (cell_y2 - cell_y1 + 1))
+        return min(len(self.key_bounds), covered_cells * self.entry_count / len(self.cells))
+
+    def clear(self):
+        """
+        Removes every key.
+        """
+        self.cells = {}
+        self.key_bounds = {}
+        self.entry_count = 0
+
+    def _cell_range(self, bounds):
+        # Return the first and last (column, row) of the grid cells covered by a bounding box
+        x1, y1, x2, y2 = bounds
+        return (int(x1 // self.cell_size), int(y1 // self.cell_size),
+                int(x2 // self.cell_size), int(y2 // self.cell_size))
+
+    def _cells(self, bounds):
+        # Yield the grid cells covered by a bounding box
+        cell_x1, cell_y1, cell_x2, cell_y2 = self._cell_range(bounds)
+        for cell_x in range(cell_x1, cell_x2 + 1):
+            for cell_y in range(cell_y1, cell_y2 + 1):
+                yield cell_x, cell_y
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageDraw
+from .schematic_file import SYMBOL_DIRECTORY, SYMBOL_SIZE, read_schematic, iter_component_instances
+
+# Default location of the on-disk thumbnail cache
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "schemtool", "thumbnails")
+
+class ThumbnailCache:
+    """
+    Renders and caches low-resolution previews of saved schematic files.
+
+    Previews are drawn straight from the saved component list with Pillow, without
+    creating any Tk canvas items. Rendered previews are stored on disk under the
+    hash of the file content, and an index of file path -> (mtime, size, hash) lets
+    unchanged files be looked up without being read again.
+
+    Attributes:
+        cache_directory (str): Directory where thumbnails and the index are stored.
+        thumbnail_size (tuple): The maximum (width, height) of a thumbnail.
+        executor (ThreadPoolExecutor): Background pool that renders thumbnails.
+
+    Methods:
+        __init__(self, cache_directory, thumbnail_size, max_workers): Constructor method.
+            Initializes the cache and loads its index from disk.
+
+        cache_key(self, file_path): Returns the content hash used to store a file's thumbnail.
+
+        get_thumbnail(self, file_path): Returns the thumbnail of a file, rendering it if needed.
+
+        request_thumbnail(self, file_path): Schedules get_thumbnail on the background pool.
+
+        save_index(self): Writes the file index to disk.
+
+        shutdown(self): Saves the index and stops the background pool.
+    """
+
+    def __init__(self, cache_directory=DEFAULT_CACHE_DIRECTORY, thumbnail_size=(160, 120), max_workers=4):
+        """
+        Initialize the cache and load its index from disk.
+
+        Parameters:
+            cache_directory (str): Directory where thumbnails and the index are stored.
+            thumbnail_size (tuple): The maximum (width, height) of a thumbnail.
+            max_workers (int): Number of background threads used for rendering.
+        """
+        self.cache_directory = cache_directory
+        self.thumbnail_size = thumbnail_size
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.index_path = os.path.join(cache_directory, "index.json")
+        self.lock = threading.Lock()
+
+        os.makedirs(cache_directory, exist_ok=True)
+        try:
+            with open(self.index_path, "r") as file:
+                self.index = json.load(file)
+        except (FileNotFoundError, ValueError):
+            self.index = {}
+
+    def cache_key(self, file_path):
+        """
+        Returns the content hash used to store a file's thumbnail.
+
+        The file is only read and hashed when its mtime or size differs from the index.
+
+        Parameters:
+            file_path (str): Path of the schematic file.
+
+        Returns:
+            str: The SHA-1 hex digest of the file content.
+        """
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+
+        with self.lock:
+            entry = self.index.get(file_path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        with open(file_path, "rb") as file:
+            digest = hashlib.sha1(file.read()).hexdigest()
+
+        with self.lock:
+            self.index[file_path] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def get_thumbnail(self, file_path):
+        """
+        Returns the thumbnail of a file, rendering it if needed.
+
+        Parameters:
+            file_path (str): Path of the schematic file.
+
+        Returns:
+            Image or None: The thumbnail as a PIL Image, or None if the file cannot be read.
+        """
+        try:
+            width, height = self.thumbnail_size
+            thumbnail_path = os.path.join(self.cache_directory, f"{self.cache_key(file_path)}_{width}x{height}.png")
+
+            if os.path.exists(thumbnail_path):
+                thumbnail = Image.open(thumbnail_path)
+                thumbnail.load()
+                return thumbnail
+
+            thumbnail = render_thumbnail(read_schematic(file_path), self.thumbnail_size)
+
+            # Write to a temporary file first so concurrent readers never see a partial image
+            temporary_path = f"{thumbnail_path}.{threading.get_ident()}.tmp"
+            thumbnail.save(temporary_path, "PNG")
+            os.replace(temporary_path, thumbnail_path)
+            return thumbnail
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Warning: Failed to create thumbnail for {file_path}: {e}")
+            return None
+
+    def request_thumbnail(self, file_path):
+        """
+        Schedules get_thumbnail on the background pool.
+
+        Parameters:
+            file_path (str): Path of the schematic file.
+
+        Returns:
+            Future: A future resolving to the thumbnail Image, or None.
+        """
+        return self.executor.submit(self.get_thumbnail, file_path)
+
+    def save_index(self):
+        """
+        Writes the file index to disk.
+        """
+        with self.lock:
+            index = dict(self.index)
+
+        with open(self.index_path, "w") as file:
+            json.dump(index, file)
+
+    def shutdown(self):
+        """
+        Saves the index and stops the background pool.
+        """
+        self.executor.shutdown(wait=False)
+        self.save_index()
+
+
+# Scaled and rotated symbol images shared by all renders, keyed by (symbol_name, rotation_angle, scale)
+_scaled_symbols = {}
+
+
+def render_thumbnail(save_data, thumbnail_size):
+    """
+    Renders a low-resolution preview of a schematic from its save data.
+
+    Parameters:
+        save_data (dict): The save data, as written by SchematicDesigner.save.
+        thumbnail_size (tuple): The maximum (width, height) of the preview.
+
+    Returns:
+        Image: The preview as an RGB PIL Image.
+
+    Raises:
+        ValueError: If the canvas size is not positive.
+    """
+    canvas_width, canvas_height = save_data.get("canvas_size", (800, 600))
+    if canvas_width <= 0 or canvas_height <= 0:
+        raise ValueError(f"Invalid canvas size {(canvas_width, canvas_height)!r}")
+    scale = min(thumbnail_size[0] / canvas_width, thumbnail_size[1] / canvas_height)
+    thumbnail = Image.new("RGB", (max(1, round(canvas_width * scale)), max(1, round(canvas_height * scale))), "white")
+
+    for instance_data in iter_component_instances(save_data):
+        symbol_image = _scaled_symbol(instance_data.get("symbol_name"), instance_data.get("rotation_angle", 0), scale)
+        if symbol_image:
+            position = (round(instance_data["x"] * scale), round(instance_data["y"] * scale))
+            thumbnail.paste(symbol_image, position, symbol_image)
+
+    # Draw routed wires as thin lines
+    draw = ImageDraw.Draw(thumbnail)
+    for wire_data in save_data.get("wires", []):
+        draw.line([(x * scale, y * scale) for x, y in wire_data["points"]], fill="black")
+
+    return thumbnail
+
+
+def _scaled_symbol(symbol_name, rotation_angle, scale):
+    key = (symbol_name, rotation_angle, round(scale, 4))
+    if key not in _scaled_symbols:
+        try:
+            symbol_image = Image.open(SYMBOL_DIRECTORY + symbol_name).convert("RGBA")
+            symbol_image = symbol_image.resize((max(1, round(SYMBOL_SIZE[0] * scale)), max(1, round(SYMBOL_SIZE[1] * scale))),
+                                               Image.BILINEAR)
+            _scaled_symbols[key] = symbol_image.rotate(rotation_angle, expand=True)
+        except (FileNotFoundError, TypeError):
+            _scaled_symbols[key] = None
+    return _scaled_symbols[key]
@@ -33,7 +33,8 @@ class UserGuideDialog(tk.Toplevel):
             "- Move Tool: Toggling this button will allow users to move items in the canvas.\n"
             "- Grid Tool: Toggle grid lines on/off for better alignment.\n"
             "- Rotate Tool: Toggling this button will rotate selected components by clicking on them.\n"
-            "- Delete Tool: Toggling this button will delete selected components.\n\n"
+            "- Delete Tool: Toggling this button will delete selected components and routed wires.\n"
+            "- Draw Tool: Click two component pins to route a wire between them around other components.\n\n"
             "- Clear Tool: Click to clear canvas.\n\n"
             "Note: Toggle buttons may be a little finicky, and might require toggling it again or another button. \n"
             "Try to keep one button toggled at a time.\n\n"
@@ -45,8 +46,18 @@ class UserGuideDialog(tk.Toplevel):
             "Menu Options:\n"
             "- File -> Save: Save the current schematic.\n"
             "- File -> Export as PNG: Export the schematic as a PNG file.\n"
+            "- File -> Export as SVG / Export as PDF: Export the schematic as a vector file.\n"
+            "- File -> Browse Schematics: Preview every schematic in a folder and open one.\n"
+            "- File -> Compare With: Outline the parts that were added, moved, rotated or removed since a saved file.\n"
+            "- File -> Clear Comparison: Remove the comparison outlines.\n"
             "- File -> Change Canvas Size: Adjust the size of the canvas.\n"
-            "- File -> Exit: Close the application.\n\n"
+            "- File -> Exit: Close the application.\n"
+            "- Blocks -> Define Block from Region: Drag a region to turn its parts into a reusable block.\n"
+            "  Redefining an existing block updates every placement of it.\n"
+            "- Blocks -> Place Block: Place another copy of a defined block.\n"
+            "- Search -> Find Components: Find parts by symbol, rotation or region,\n"
+            "  e.g. symbol=capacitor rotation=45 region=0,0,400,300, then rotate, delete or replace them all at once.\n"
+            "- Design Rules -> Show Violations: Mark overlapping, stacked, out-of-bounds parts and unconnected wire ends.\n\n"
             "Coming Soon:\n"
             "- Snap functionality\n"
             "- More tools\n"
@@ -0,0 +1,271 @@
+import base64
+import math
+import re
+import zlib
+from PIL import Image
+from .schematic_file import SYMBOL_DIRECTORY, SYMBOL_SIZE, rotated_size, iter_component_instances
+
+class VectorExporter:
+    """
+    Exports the saved component list of a schematic as a vector SVG or PDF file.
+
+    Each symbol from the component symbols directory is written to the file once,
+    as an SVG <symbol> or a PDF image XObject. Component instances are then placed
+    by reference with a transform for their position and rotation angle, so the
+    file size grows by a few bytes per part instead of a bitmap per part.
+
+    Instances are written in a single streaming pass, and the symbol definitions
+    they reference are appended once all instances have been written. Each symbol
+    is loaded the first time it is referenced; instances whose symbol cannot be
+    loaded are skipped, so the file never refers to a missing definition. Placed
+    blocks are expanded into their components as they are written.
+
+    Attributes:
+        canvas_size (tuple): The (width, height) of the exported page.
+        save_data (dict): The save data being exported.
+        wires (iterable): The saved routed wires, as dictionaries with a "points" list.
+
+    Methods:
+        __init__(self, save_data): Constructor method.
+            Initializes the exporter from the save data of a schematic.
+
+        export_svg(self, file_path): Writes the schematic as an SVG file.
+
+        export_pdf(self, file_path): Writes the schematic as a single-page PDF file.
+
+        placement(self, instance_data): Returns the center and rotation of a component instance.
+    """
+
+    def __init__(self, save_data):
+        """
+        Initialize the exporter from the save data of a schematic.
+
+        Parameters:
+            save_data (dict): The save data, as written by SchematicDesigner.save.
+        """
+        self.canvas_size = tuple(save_data.get("canvas_size", (800, 600)))
+        self.save_data = save_data
+        self.wires = save_data.get("wires", [])
+
+    def placement(self, instance_data):
+        """
+        Returns the center and rotation of a component instance.
+
+        Components are anchored at the top-left corner of their rotated image,
+        so the center is offset by half of the rotated size.
+
+        Parameters:
+            instance_data (dict): The saved component instance.
+
+        Returns:
+            tuple: The (center_x, center_y, rotation_angle) of the instance.
+        """
+        rotation_angle = instance_data.get("rotation_angle", 0)
+        rotated_width, rotated_height = rotated_size(rotation_angle)
+        return (instance_data["x"] + rotated_width / 2,
+                instance_data["y"] + rotated_height / 2,
+                rotation_angle)
+
+    def export_svg(self, file_path):
+        """
+        Writes the schematic as an SVG file.
+
+        Parameters:
+            file_path (str): Path of the SVG file to write.
+        """
+        width, height = self.canvas_size
+        symbol_width, symbol_height = SYMBOL_SIZE
+        symbol_ids, symbol_data = {}, {}
+
+        with open(file_path, "w") as file:
+            file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            file.write(f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+                       f'width="{width}" height="{height}" viewBox="0 0 {width} {height}">\n')
+            file.write(f'<rect width="{width}" height="{height}" fill="white"/>\n')
+
+            # Place each instance by reference to its symbol
+            for instance_data in iter_component_instances(self.save_data):
+                symbol_name = instance_data.get("symbol_name")
+                if symbol_name not in symbol_data:
+                    symbol_data[symbol_name] = _read_symbol_file(symbol_name)
+                    if symbol_data[symbol_name] is not None:
+                        symbol_ids[symbol_name] = _symbol_id(symbol_name, len(symbol_ids))
+                if symbol_data[symbol_name] is None:
+                    continue
+
+                center_x, center_y, rotation_angle = self.placement(instance_data)
+                file.write(f'<use xlink:href="#{symbol_ids[symbol_name]}" width="{symbol_width}" height="{symbol_height}" '
+                           f'transform="translate({center_x:g} {center_y:g}) rotate({-rotation_angle:g}) '
+                           f'translate({-symbol_width / 2:g} {-symbol_height / 2:g})"/>\n')
+
+            # Draw routed wires as polylines
+            for wire_data in self.wires:
+                if len(wire_data.get("points", [])) < 2:
+                    continue
+                points = " ".join(f"{x:g},{y:g}" for x, y in wire_data["points"])
+                file.write(f'<polyline points="{points}" fill="none" stroke="black" stroke-width="2"/>\n')
+
+            # Define each referenced symbol once, embedding the original symbol image
+            file.write("<defs>\n")
+            for symbol_name, symbol_id in symbol_ids.items():
+                encoded_image = base64.b64encode(symbol_data[symbol_name]).decode("ascii")
+                file.write(f'<symbol id="{symbol_id}" viewBox="0 0 {symbol_width} {symbol_height}">'
+                           f'<image width="{symbol_width}" height="{symbol_height}" preserveAspectRatio="none" '
+                           f'xlink:href="data:image/png;base64,{encoded_image}"/></symbol>\n')
+            file.write("</defs>\n")
+            file.write("</svg>\n")
+
+    def export_pdf(self, file_path):
+        """
+        Writes the schematic as a single-page PDF file.
+
+        The page content stream is compressed as it is written, and each symbol is
+        stored once as an image XObject with its alpha channel as a soft mask.
+
+        Parameters:
+            file_path (str): Path of the PDF file to write.
+        """
+        width, height = self.canvas_size
+        symbol_width, symbol_height = SYMBOL_SIZE
+        writer = _PdfWriter(file_path)
+
+        # Fixed objects: catalog, page tree, page, resources, content stream and its length
+        writer.write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        writer.write_object(2, b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>")
+        writer.write_object(3, f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] "
+                               f"/Resources 4 0 R /Contents 5 0 R >>".encode("ascii"))
+
+        symbol_names, symbol_images = {}, {}
+        writer.begin_stream(5, b"<< /Length 6 0 R /Filter /FlateDecode >>")
+        writer.write_stream(f"1 1 1 rg 0 0 {width} {height} re f\n".encode("ascii"))
+
+        for instance_data in iter_component_instances(self.save_data):
+            symbol_name = instance_data.get("symbol_name")
+            if symbol_name not in symbol_images:
+                symbol_images[symbol_name] = _load_symbol_image(symbol_name)
+                if symbol_images[symbol_name] is not None:
+                    symbol_names[symbol_name] = f"S{len(symbol_names)}"
+            if symbol_images[symbol_name] is None:
+                continue
+
+            # PDF has a bottom-left origin, so flip the y-axis around the page height
+            center_x, center_y, rotation_angle = self.placement(instance_data)
+            center_y = height - center_y
+            angle = math.radians(rotation_angle)
+            a, b = symbol_width * math.cos(angle), symbol_width * math.sin(angle)
+            c, d = -symbol_height * math.sin(angle), symbol_height * math.cos(angle)
+            e, f = center_x - (a + c) / 2, center_y - (b + d) / 2
+
+            writer.write_stream(f"q {a:.4f} {b:.4f} {c:.4f} {d:.4f} {e:.4f} {f:.4f} cm "
+                                f"/{symbol_names[symbol_name]} Do Q\n".encode("ascii"))
+
+        # Stroke routed wires as paths
+        for wire_data in self.wires:
+            if len(wire_data.get("points", [])) < 2:
+                continue
+            (start_x, start_y), *corners = wire_data["points"]
+            path = f"{start_x:.4f} {height - start_y:.4f} m " + "".join(f"{x:.4f} {height - y:.4f} l " for x, y in corners)
+            writer.write_stream(f"0 0 0 RG 2 w {path}S\n".encode("ascii"))
+
+        stream_length = writer.end_stream()
+        writer.write_object(6, str(stream_length).encode("ascii"))
+
+        # Define each referenced symbol once as an image XObject
+        xobjects = []
+        next_object = 7
+        for symbol_name, resource_name in symbol_names.items():
+            symbol_image = symbol_images[symbol_name]
+            image_width, image_height = symbol_image.size
+            rgb_data = zlib.compress(symbol_image.convert("RGB").tobytes())
+            alpha_data = zlib.compress(symbol_image.getchannel("A").tobytes())
+
+            writer.write_object(next_object, f"<< /Type /XObject /Subtype /Image /Width {image_width} "
+                                             f"/Height {image_height} /ColorSpace /DeviceRGB /BitsPerComponent 8 "
+                                             f"/Filter /FlateDecode /SMask {next_object + 1} 0 R "
+                                             f"/Length {len(rgb_data)} >>".encode("ascii"), rgb_data)
+            writer.write_object(next_object + 1, f"<< /Type /XObject /Subtype /Image /Width {image_width} "
+                                                 f"/Height {image_height} /ColorSpace /DeviceGray /BitsPerComponent 8 "
+                                                 f"/Filter /FlateDecode /Length {len(alpha_data)} >>".encode("ascii"),
+                                alpha_data)
+            xobjects.append(f"/{resource_name} {next_object} 0 R")
+            next_object += 2
+
+        writer.write_object(4, f"<< /XObject << {' '.join(xobjects)} >> >>".encode("ascii"))
+        writer.close(root_object=1)
+
+
+class _PdfWriter:
+    """
+    Minimal streaming writer for the objects and cross-reference table of a PDF file.
+
+    Objects may be written in any order; their offsets are recorded as they are
+    written and the cross-reference table is emitted in object number order on close.
+    """
+
+    def __init__(self, file_path):
+        self.file = open(file_path, "wb")
+        self.offsets = {}
+        self.compressor = None
+        self.stream_length = 0
+        self.file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def write_object(self, number, dictionary, stream_data=None):
+        self.offsets[number] = self.file.tell()
+        self.file.write(f"{number} 0 obj\n".encode("ascii") + dictionary)
+        if stream_data is not None:
+            self.file.write(b"\nstream\n" + stream_data + b"\nendstream")
+        self.file.write(b"\nendobj\n")
+
+    def begin_stream(self, number, dictionary):
+        self.offsets[number] = self.file.tell()
+        self.file.write(f"{number} 0 obj\n".encode("ascii") + dictionary + b"\nstream\n")
+        self.compressor = zlib.compressobj()
+        self.stream_length = 0
+
+    def write_stream(self, data):
+        compressed = self.compressor.compress(data)
+        self.file.write(compressed)
+        self.stream_length += len(compressed)
+
+    def end_stream(self):
+        compressed = self.compressor.flush()
+        self.file.write(compressed + b"\nendstream\nendobj\n")
+        self.stream_length += len(compressed)
+        self.compressor = None
+        return self.stream_length
+
+    def close(self, root_object):
+        xref_offset = self.file.tell()
+        object_count = max(self.offsets) + 1
+        self.file.write(f"xref\n0 {object_count}\n".encode("ascii"))
+        self.file.write(b"0000000000 65535 f \n")
+        for number in range(1, object_count):
+            self.file.write(f"{self.offsets.get(number, 0):010d} 00000 n \n".encode("ascii"))
+        self.file.write(f"trailer\n<< /Size {object_count} /Root {root_object} 0 R >>\n"
+                        f"startxref\n{xref_offset}\n%%EOF\n".encode("ascii"))
+        self.file.close()
+
+
+def _read_symbol_file(symbol_name):
+    # Return the bytes of a symbol image file, or None if it cannot be read
+    try:
+        with open(SYMBOL_DIRECTORY + symbol_name, "rb") as symbol_file:
+            return symbol_file.read()
+    except (OSError, TypeError):
+        print(f"Warning: Failed to load symbol image for {symbol_name}")
+        return None
+
+
+def _load_symbol_image(symbol_name):
+    # Return a symbol image as RGBA, or None if it cannot be loaded
+    try:
+        return Image.open(SYMBOL_DIRECTORY + symbol_name).convert("RGBA")
+    except (OSError, TypeError):
+        print(f"Warning: Failed to load symbol image for {symbol_name}")
+        return None
+
+
+def _symbol_id(symbol_name, index):
+    # Build an XML-safe id from the symbol file name, e.g. "op_amp.png" -> "op_amp"
+    base_name = re.sub(r"[^A-Za-z0-9_-]", "_", str(symbol_name).rsplit(".", 1)[0])
+    return f"{base_name}-{index}"
@@ -0,0 +1,368 @@
+import heapq
+import math
+
+# Spacing of the grid drawn by SchematicDesigner.draw_grid, which wires are routed along
+GRID_SIZE = 20
+
+# Weight of the distance estimate in the A* search. Above 1 the search heads for the
+# goal more directly and expands far fewer points, at the cost of routes up to that
+# factor longer than the shortest one (a few percent longer in practice). Layouts with
+# 45 degree parts leave many narrow gaps, and a lower weight explores far more of them
+HEURISTIC_WEIGHT = 1.5
+
+# States of the points of a search grid
+_BLOCKED, _UNKNOWN = b"\x01", b"\x02"
+
+# Largest walled-in area around a pin, in grid points, that is flood filled before searching
+POCKET_LIMIT = 256
+
+class WireRouter:
+    """
+    Routes wires between component pins along the canvas grid.
+
+    Uses A* search over grid points with a weighted Manhattan distance heuristic.
+    Among equally good routes the search prefers to keep going straight, and a
+    final pass replaces staircases with single corners where the grid is free, so
+    routes are short with few corners. The search is limited to the bounding box
+    of the two pins plus a margin, which is widened whenever no route is found
+    inside it, up to the whole canvas. Grid points inside a component's bounding
+    box are obstacles; they are looked up in the spatial index a tile at a time as
+    the search reaches them. A pin walled in by components is detected without
+    searching the whole canvas.
+
+    Attributes:
+        spatial_index (SpatialIndex): Bounding boxes of the placed components.
+        canvas_size (tuple): The (width, height) of the canvas; routes stay within it plus a small margin.
+        grid_size (int): Spacing of the routing grid.
+        search_margin (int): Initial margin around the pins' bounding box, in grid steps.
+
+    Methods:
+        __init__(self, spatial_index, canvas_size, grid_size, search_margin): Constructor method.
+            Initializes the router.
+
+        route(self, start_pin, end_pin): Returns a polyline connecting two pins, or None.
+
+        is_blocked(self, cell): Returns True if a grid point lies inside a component.
+    """
+
+    def __init__(self, spatial_index, canvas_size, grid_size=GRID_SIZE, search_margin=20):
+        """
+        Initialize the router.
+
+        Parameters:
+            spatial_index (SpatialIndex): Bounding boxes of the placed components.
+            canvas_size (tuple): The (width, height) of the canvas.
+            grid_size (int): Spacing of the routing grid.
+            search_margin (int): Initial margin around the pins' bounding box, in grid steps.
+        """
+        self.spatial_index = spatial_index
+        self.grid_size = grid_size
+        self.search_margin = search_margin
+        self.blocked_cells = {}
+
+        # Allow routes to run a couple of grid steps outside the canvas
+        self.min_cell = -2
+        self.max_cell_x = int(canvas_size[0] // grid_size) + 2
+        self.max_cell_y = int(canvas_size[1] // grid_size) + 2
+
+    def route(self, start_pin, end_pin):
+        """
+        Returns a polyline connecting two pins, or None if no route exists.
+
+        Each pin is first connected to the nearest free grid point, and the grid
+        points are then joined by the A* search. None is only returned when a pin
+        is walled in by components, the search failed across the whole canvas, or
+        both pins are the same point, since there is nothing to connect.
+
+        Parameters:
+            start_pin (tuple): The (x, y) position of the first pin.
+            end_pin (tuple): The (x, y) position of the second pin.
+
+        Returns:
+            list or None: The (x, y) corner points of the wire, starting and ending at the pins.
+        """
+        if start_pin == end_pin:
+            return None
+
+        start_cell = self._nearest_free_cell(start_pin)
+        end_cell = self._nearest_free_cell(end_pin)
+        if start_cell is None or end_cell is None:
+            return None
+
+        # Long routes are more likely to need a detour, so they start with a wider window
+        margin = max(self.search_margin, (abs(start_cell[0] - end_cell[0]) + abs(start_cell[1] - end_cell[1])) // 4)
+        full_window = (self.min_cell, self.min_cell, self.max_cell_x, self.max_cell_y)
+        while True:
+            window = (max(self.min_cell, min(start_cell[0], end_cell[0]) - margin),
+                      max(self.min_cell, min(start_cell[1], end_cell[1]) - margin),
+                      min(self.max_cell_x, max(start_cell[0], end_cell[0]) + margin),
+                      min(self.max_cell_y, max(start_cell[1], end_cell[1]) + margin))
+            grid = _SearchGrid(window, full_window, self.spatial_index, self.grid_size)
+
+            # A pin walled in by nearby components can only reach the other pin if it is in the same pocket
+            for pin_cell, other_cell in ((start_cell, end_cell), (end_cell, start_cell)):
+                pocket = grid.enclosed_region(pin_cell, limit=POCKET_LIMIT)
+                if pocket is not None and grid.index(other_cell) not in pocket:
+                    return None
+
+            corners = grid.search(start_cell, end_cell)
+            if corners is not None:
+                break
+
+            # A wider window can only help if both pins can reach a side of the window that can grow
+            if window == full_window or grid.enclosed_region(start_cell) is not None or grid.enclosed_region(end_cell) is not None:
+                return None
+            margin *= 4
+
+        points = [start_pin] + [(cell_x * self.grid_size, cell_y * self.grid_size) for cell_x, cell_y in corners] + [end_pin]
+        return _simplify(points)
+
+    def is_blocked(self, cell):
+        """
+        Returns True if a grid point lies inside a component's bounding box.
+
+        Points on the edge of a bounding box are free, so wires can run along parts.
+
+        Parameters:
+            cell (tuple): The (column, row) of the grid point.
+
+        Returns:
+            bool: True if the grid point cannot be routed through.
+        """
+        if cell not in self.blocked_cells:
+            x, y = cell[0] * self.grid_size, cell[1] * self.grid_size
+            blocked = False
+            for key in self.spatial_index.query_point(x, y):
+                x1, y1, x2, y2 = self.spatial_index.bounds(key)
+                if x1 < x < x2 and y1 < y < y2:
+                    blocked = True
+                    break
+            self.blocked_cells[cell] = blocked
+        return self.blocked_cells[cell]
+
+    def _in_bounds(self, cell):
+        return self.min_cell <= cell[0] <= self.max_cell_x and self.min_cell <= cell[1] <= self.max_cell_y
+
+    def _nearest_free_cell(self, pin, max_radius=3):
+        # Search rings of grid points around the pin for the closest free one
+        pin_x, pin_y = pin
+        center_x, center_y = round(pin_x / self.grid_size), round(pin_y / self.grid_size)
+
+        for radius in range(max_radius + 1):
+            candidates = [(center_x + dx, center_y + dy)
+                          for dx in range(-radius, radius + 1) for dy in range(-radius, radius + 1)
+                          if max(abs(dx), abs(dy)) == radius]
+            free = [cell for cell in candidates if self._in_bounds(cell) and not self.is_blocked(cell)]
+            if free:
+                return min(free, key=lambda cell: (cell[0] * self.grid_size - pin_x) ** 2 + (cell[1] * self.grid_size - pin_y) ** 2)
+        return None
+
+
+class _SearchGrid:
+    """
+    Flat grid of the points inside a search window, with obstacles marked on demand.
+
+    Grid points are numbered row by row so the A* search can keep its state in
+    flat lists instead of dictionaries keyed by tuples. The grid is surrounded by
+    a ring of blocked points, so the search never has to check the window bounds.
+    Obstacles are looked up in the spatial index one tile of grid points at a time,
+    the first time the search reaches the tile, so the cost follows the area the
+    search explores rather than the size of the window.
+    The sides of the window that do not lie on the edge of the full routing area
+    are open: a route may continue past them once the window is widened.
+    """
+
+    def __init__(self, window, full_window, spatial_index, grid_size, tile_size=8):
+        self.min_x, self.min_y, self.max_x, self.max_y = window
+        self.width = self.max_x - self.min_x + 1
+        self.height = self.max_y - self.min_y + 1
+        self.stride = self.width + 2
+        self.spatial_index = spatial_index
+        self.grid_size = grid_size
+        self.tile_size = tile_size
+        self.open_sides = (self.min_x > full_window[0], self.min_y > full_window[1],
+                           self.max_x < full_window[2], self.max_y < full_window[3])
+
+        # Block the surrounding ring; points inside are unknown until their tile is loaded
+        self.blocked = bytearray(_BLOCKED * self.stride + (_BLOCKED + _UNKNOWN * self.width + _BLOCKED) * self.height +
+                                 _BLOCKED * self.stride)
+
+    def index(self, cell):
+        return (cell[1] - self.min_y + 1) * self.stride + cell[0] - self.min_x + 1
+
+    def _cell(self, index):
+        row, column = divmod(index, self.stride)
+        return column - 1 + self.min_x, row - 1 + self.min_y
+
+    def is_blocked(self, index):
+        # Returns the blocked flag of a grid point, loading its tile first if needed
+        if self.blocked[index] == _UNKNOWN[0]:
+            self._load_tile(index)
+        return self.blocked[index]
+
+    def is_free(self, cell):
+        return (self.min_x <= cell[0] <= self.max_x and self.min_y <= cell[1] <= self.max_y
+                and not self.is_blocked(self.index(cell)))
+
+    def _load_tile(self, index):
+        # Mark the grid points of the tile containing a point, blocking those strictly inside a component
+        tile_size, grid_size, stride, blocked = self.tile_size, self.grid_size, self.stride, self.blocked
+        cell_x, cell_y = self._cell(index)
+        x1 = self.min_x + (cell_x - self.min_x) // tile_size * tile_size
+        y1 = self.min_y + (cell_y - self.min_y) // tile_size * tile_size
+        x2, y2 = min(x1 + tile_size - 1, self.max_x), min(y1 + tile_size - 1, self.max_y)
+
+        # Offset of the tile's top-left point; each row starts one stride further
+        origin = (y1 - self.min_y + 1) * stride + 1 - self.min_x
+        free_run = b"\x00" * (x2 - x1 + 1)
+        for row_offset in range(origin, origin + (y2 - y1 + 1) * stride, stride):
+            blocked[row_offset + x1:row_offset + x2 + 1] = free_run
+
+        for key in self.spatial_index.query((x1 * grid_size, y1 * grid_size, x2 * grid_size, y2 * grid_size)):
+            key_x1, key_y1, key_x2, key_y2 = self.spatial_index.bounds(key)
+            first_x = max(x1, math.floor(key_x1 / grid_size) + 1)
+            last_x = min(x2, math.ceil(key_x2 / grid_size) - 1)
+            first_y = max(y1, math.floor(key_y1 / grid_size) + 1)
+            last_y = min(y2, math.ceil(key_y2 / grid_size) - 1)
+            if first_x > last_x or first_y > last_y:
+                continue
+
+            blocked_run = _BLOCKED * (last_x - first_x + 1)
+            for row_offset in range(origin + (first_y - y1) * stride, origin + (last_y - y1 + 1) * stride, stride):
+                blocked[row_offset + first_x:row_offset + last_x + 1] = blocked_run
+
+    def enclosed_region(self, cell, limit=None):
+        # Flood fill from a grid point; returns the points reached if they are walled in
+        # without touching an open side of the window, or None as soon as the fill escapes
+        # or grows past the limit
+        stride, is_blocked = self.stride, self.is_blocked
+        open_left, open_top, open_right, open_bottom = self.open_sides
+        start = self.index(cell)
+        region = {start}
+        stack = [start]
+
+        while stack:
+            current = stack.pop()
+            row, column = divmod(current, stride)
+            if ((open_left and column == 1) or (open_top and row == 1) or
+                    (open_right and column == self.width) or (open_bottom and row == self.height)):
+                return None
+
+            for neighbour in (current + 1, current - 1, current + stride, current - stride):
+                if neighbour not in region and not is_blocked(neighbour):
+                    region.add(neighbour)
+                    stack.append(neighbour)
+            if limit is not None and len(region) > limit:
+                return None
+        return region
+
+    def search(self, start_cell, end_cell):
+        # Weighted A* from start to end; returns the corner cells of the route or None
+        stride, blocked = self.stride, self.blocked
+        start, end = self.index(start_cell), self.index(end_cell)
+        end_row, end_column = divmod(end, stride)
+
+        # Costs start above any real route length, so unreached points always improve
+        unreached = len(blocked)
+        cost = [unreached] * len(blocked)
+        bends = [0] * len(blocked)
+        direction = bytearray(b"\x04" * len(blocked))
+        closed = bytearray(len(blocked))
+        came_from = {start: start}
+        unknown = _UNKNOWN[0]
+
+        cost[start] = 0
+        start_row, start_column = divmod(start, stride)
+        start_distance = abs(start_column - end_column) + abs(start_row - end_row)
+        open_heap = [(start_distance, start_distance, 0, start)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        while open_heap:
+            _, distance, _, current = heappop(open_heap)
+            if closed[current]:
+                continue
+            if current == end:
+                return self._corners(came_from, end)
+            closed[current] = 1
+
+            next_cost = cost[current] + 1
+            current_bends = bends[current]
+            current_direction = direction[current]
+            row, column = divmod(current, stride)
+
+            # Each step moves one grid point closer to or further from the end
+            for step_direction, neighbour, closer in ((0, current + 1, column < end_column),
+                                                      (1, current + stride, row < end_row),
+                                                      (2, current - 1, column > end_column),
+                                                      (3, current - stride, row > end_row)):
+                state = blocked[neighbour]
+                if state == unknown:
+                    state = self.is_blocked(neighbour)
+                if state or closed[neighbour]:
+                    continue
+
+                neighbour_bends = current_bends + (current_direction != 4 and step_direction != current_direction)
+                known_cost = cost[neighbour]
+                # Equally short routes with fewer bends replace the known one
+                if next_cost < known_cost or (next_cost == known_cost and neighbour_bends < bends[neighbour]):
+                    cost[neighbour] = next_cost
+                    bends[neighbour] = neighbour_bends
+                    came_from[neighbour] = current
+                    direction[neighbour] = step_direction
+                    neighbour_distance = distance - 1 if closer else distance + 1
+                    # Prefer points closer to the goal, then fewer bends, when estimates tie
+                    heappush(open_heap, (next_cost + HEURISTIC_WEIGHT * neighbour_distance, neighbour_distance,
+                                         neighbour_bends, neighbour))
+        return None
+
+    def _corners(self, came_from, end):
+        # Walk back from the end to rebuild the route and keep only its corners
+        cells = [end]
+        while came_from[cells[-1]] != cells[-1]:
+            cells.append(came_from[cells[-1]])
+        cells = [self._cell(cell) for cell in reversed(cells)]
+        return self._straighten(_simplify(cells))
+
+    def _straighten(self, corners):
+        # Replace a staircase of three runs by two runs with one corner where the grid is free
+        index = 0
+        while index + 3 < len(corners):
+            first, last = corners[index], corners[index + 3]
+            run_length = sum(abs(a[0] - b[0]) + abs(a[1] - b[1]) for a, b in zip(corners[index:index + 3], corners[index + 1:index + 4]))
+
+            replaced = False
+            if run_length == abs(first[0] - last[0]) + abs(first[1] - last[1]):
+                for corner in ((first[0], last[1]), (last[0], first[1])):
+                    if self._run_is_free(first, corner) and self._run_is_free(corner, last):
+                        corners[index + 1:index + 3] = [corner]
+                        corners[:] = _simplify(corners)
+                        replaced = True
+                        break
+
+            if replaced:
+                index = max(0, index - 2)
+            else:
+                index += 1
+        return corners
+
+    def _run_is_free(self, start, end):
+        # True if every grid point on a horizontal or vertical run is free
+        step_x = (end[0] > start[0]) - (end[0] < start[0])
+        step_y = (end[1] > start[1]) - (end[1] < start[1])
+        length = max(abs(end[0] - start[0]), abs(end[1] - start[1]))
+        return all(self.is_free((start[0] + step_x * step, start[1] + step_y * step)) for step in range(length + 1))
+
+
+def _simplify(points):
+    # Drop repeated points and points in the middle of a straight horizontal or vertical run
+    simplified = []
+    for point in points:
+        if simplified and point == simplified[-1]:
+            continue
+        if len(simplified) >= 2:
+            (x1, y1), (x2, y2) = simplified[-2], simplified[-1]
+            if (x1 == x2 == point[0]) or (y1 == y2 == point[1]):
+                simplified[-1] = point
+                continue
+        simplified.append(point)
+    return simplified
@@ -0,0 +1,99 @@
+import unittest
+from schematic_designer.schematic_diff import SchematicDiff, merge_schematics
+
+# A schematic saved before components had ids
+LEGACY_BASE = {
+    "canvas_size": (800, 600),
+    "component_instances": [
+        {"symbol_name": "resistor.png", "x": 100, "y": 100, "rotation_angle": 0},
+        {"symbol_name": "capacitor.png", "x": 300, "y": 100, "rotation_angle": 0},
+    ],
+}
+
+
+def saved_after_load(save_data):
+    # The ids a legacy file gets when it is loaded and saved again
+    return dict(save_data, component_instances=[dict(instance_data, id=f"#{index}")
+                                                for index, instance_data in enumerate(save_data["component_instances"])])
+
+
+class LegacyMergeTest(unittest.TestCase):
+    def test_parallel_edits_of_legacy_file_merge_without_duplicates(self):
+        ours = saved_after_load(LEGACY_BASE)
+        ours["component_instances"][0]["x"] = 140
+        theirs = saved_after_load(LEGACY_BASE)
+        theirs["component_instances"][1]["rotation_angle"] = 90
+
+        merged_data, conflicts = merge_schematics(LEGACY_BASE, ours, theirs)
+
+        self.assertEqual(conflicts, [])
+        self.assertEqual([(instance_data["id"], instance_data["x"], instance_data["rotation_angle"])
+                          for instance_data in merged_data["component_instances"]],
+                         [("#0", 140, 0), ("#1", 300, 90)])
+
+    def test_diff_of_legacy_file_reports_only_the_edit(self):
+        ours = saved_after_load(LEGACY_BASE)
+        ours["component_instances"][0]["x"] = 140
+
+        schematic_diff = SchematicDiff(LEGACY_BASE, ours)
+
+        self.assertEqual((schematic_diff.added, schematic_diff.removed), ([], []))
+        self.assertEqual([new["id"] for _, new in schematic_diff.moved], ["#0"])
+        self.assertTrue(SchematicDiff(LEGACY_BASE, saved_after_load(LEGACY_BASE)).is_empty())
+
+    def test_different_moves_of_one_component_conflict(self):
+        ours = saved_after_load(LEGACY_BASE)
+        ours["component_instances"][0]["x"] = 400
+        theirs = saved_after_load(LEGACY_BASE)
+        theirs["component_instances"][0]["y"] = 500
+
+        merged_data, conflicts = merge_schematics(LEGACY_BASE, ours, theirs)
+
+        self.assertEqual([(conflict.component_id, conflict.field, conflict.ours, conflict.theirs) for conflict in conflicts],
+                         [("#0", "x,y", (400, 100), (100, 500))])
+        self.assertEqual((merged_data["component_instances"][0]["x"], merged_data["component_instances"][0]["y"]),
+                         (400, 100))
+
+
+# A schematic that places one block
+BLOCK_BASE = {
+    "canvas_size": (800, 600),
+    "component_instances": [],
+    "block_definitions": {"amp": {"component_instances": [{"id": "r1", "symbol_name": "resistor.png", "x": 0, "y": 0}]}},
+    "block_instances": [{"id": "B1", "block_name": "amp", "x": 100, "y": 100, "rotation_angle": 0}],
+}
+
+
+class BlockMergeTest(unittest.TestCase):
+    def test_deleted_definition_still_placed_on_other_side_is_kept(self):
+        ours = dict(BLOCK_BASE, block_instances=BLOCK_BASE["block_instances"] +
+                    [{"id": "B2", "block_name": "amp", "x": 400, "y": 100, "rotation_angle": 0}])
+        theirs = dict(BLOCK_BASE, block_definitions={}, block_instances=[])
+
+        merged_data, conflicts = merge_schematics(BLOCK_BASE, ours, theirs)
+
+        self.assertEqual([block_data["id"] for block_data in merged_data["block_instances"]], ["B2"])
+        self.assertIn("amp", merged_data["block_definitions"])
+        self.assertEqual([(conflict.component_id, conflict.field) for conflict in conflicts], [("B2", "block_definition")])
+
+    def test_deleting_last_definition_merges(self):
+        theirs = dict(BLOCK_BASE, block_definitions={}, block_instances=[])
+
+        merged_data, conflicts = merge_schematics(BLOCK_BASE, BLOCK_BASE, theirs)
+
+        self.assertEqual(conflicts, [])
+        self.assertEqual((merged_data["block_definitions"], merged_data["block_instances"]), ({}, []))
+
+    def test_different_moves_of_one_block_conflict(self):
+        ours = dict(BLOCK_BASE, block_instances=[dict(BLOCK_BASE["block_instances"][0], x=400)])
+        theirs = dict(BLOCK_BASE, block_instances=[dict(BLOCK_BASE["block_instances"][0], y=500)])
+
+        merged_data, conflicts = merge_schematics(BLOCK_BASE, ours, theirs)
+
+        self.assertEqual([(conflict.component_id, conflict.field, conflict.ours, conflict.theirs) for conflict in conflicts],
+                         [("B1", "x,y", (400, 100), (100, 500))])
+        self.assertEqual((merged_data["block_instances"][0]["x"], merged_data["block_instances"][0]["y"]), (400, 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+from schematic_designer.spatial_index import SpatialIndex
+
+
+class SpatialIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.spatial_index = SpatialIndex()
+        self.spatial_index.insert("r1", (100, 100, 220, 160))
+        self.spatial_index.insert("r2", (500, 300, 620, 360))
+        self.spatial_index.insert("c1", (5000, 5000, 5120, 5060))
+
+    def test_region_larger_than_the_occupied_cells_matches_small_query(self):
+        self.assertEqual(self.spatial_index.query((0, 0, 1000000, 1000000)), {"r1", "r2", "c1"})
+        self.assertEqual(self.spatial_index.query((200, 0, 1000000000, 400)), {"r1", "r2"})
+        self.assertEqual(self.spatial_index.query((200, 0, 600, 400)), {"r1", "r2"})
+
+    def test_estimate_of_huge_region_is_bounded(self):
+        self.assertLessEqual(self.spatial_index.estimate_count((0, 0, 1000000, 1000000)), len(self.spatial_index))
+
+    def test_point_query_excludes_removed_keys(self):
+        self.spatial_index.remove("r1")
+
+        self.assertEqual(self.spatial_index.query_point(150, 130), set())
+        self.assertEqual(self.spatial_index.query_point(550, 330), {"r2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
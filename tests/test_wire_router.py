@@ -0,0 +1,71 @@
+import random
+import unittest
+from schematic_designer.schematic_file import component_bounds, symbol_pins
+from schematic_designer.spatial_index import SpatialIndex
+from schematic_designer.wire_router import GRID_SIZE, WireRouter
+
+
+def index_of(boxes):
+    # A spatial index holding each (x1, y1, x2, y2) box under its list position
+    spatial_index = SpatialIndex()
+    for key, bounds in enumerate(boxes):
+        spatial_index.insert(key, bounds)
+    return spatial_index
+
+
+def blocked_points(spatial_index, points):
+    # The grid points along the routed segments that lie strictly inside a box.
+    # The first and last segments join the pins to the grid and are not checked.
+    blocked = []
+    for (x1, y1), (x2, y2) in zip(points[1:-2], points[2:-1]):
+        steps = int(max(abs(x2 - x1), abs(y2 - y1)) // GRID_SIZE)
+        for step in range(steps + 1):
+            x, y = x1 + (x2 - x1) * step / max(steps, 1), y1 + (y2 - y1) * step / max(steps, 1)
+            for key in spatial_index.query_point(x, y):
+                box_x1, box_y1, box_x2, box_y2 = spatial_index.bounds(key)
+                if box_x1 < x < box_x2 and box_y1 < y < box_y2:
+                    blocked.append((x, y))
+    return blocked
+
+
+class WireRouterTest(unittest.TestCase):
+    def test_route_goes_around_a_component(self):
+        spatial_index = index_of([(300, 100, 500, 500)])
+
+        points = WireRouter(spatial_index, (800, 600)).route((100, 300), (700, 300))
+
+        self.assertEqual((points[0], points[-1]), ((100, 300), (700, 300)))
+        self.assertEqual(blocked_points(spatial_index, points), [])
+        self.assertTrue(all(x1 == x2 or y1 == y2 for (x1, y1), (x2, y2) in zip(points, points[1:])))
+
+    def test_walled_in_pin_has_no_route(self):
+        spatial_index = index_of([(400, 200, 600, 240), (400, 360, 600, 400), (400, 200, 440, 400), (560, 200, 600, 400)])
+
+        self.assertIsNone(WireRouter(spatial_index, (800, 600)).route((500, 300), (100, 100)))
+        self.assertIsNone(WireRouter(spatial_index, (800, 600)).route((100, 100), (500, 300)))
+
+    def test_identical_pins_have_no_route(self):
+        self.assertIsNone(WireRouter(index_of([]), (800, 600)).route((100, 130), (100, 130)))
+
+    def test_routes_between_rotated_parts_avoid_every_component(self):
+        generator = random.Random(7)
+        placements = [(generator.uniform(0, 1870), generator.uniform(0, 1370), generator.choice([0, 45, 90]))
+                      for _ in range(120)]
+        spatial_index = index_of([component_bounds(*placement) for placement in placements])
+        router = WireRouter(spatial_index, (2000, 1500))
+
+        routed = 0
+        for _ in range(20):
+            start, end = generator.sample(placements, 2)
+            start_pin, end_pin = symbol_pins(*start)[0], symbol_pins(*end)[1]
+            points = router.route(start_pin, end_pin)
+            if points is not None:
+                routed += 1
+                self.assertEqual((points[0], points[-1]), (start_pin, end_pin))
+                self.assertEqual(blocked_points(spatial_index, points), [])
+
+        self.assertGreater(routed, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()